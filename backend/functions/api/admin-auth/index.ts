@@ -2,11 +2,13 @@ import { APIGatewayProxyHandler, APIGatewayProxyResult } from 'aws-lambda';
 import { SecretsManagerClient, GetSecretValueCommand } from '@aws-sdk/client-secrets-manager';
 import { DynamoDBClient } from '@aws-sdk/client-dynamodb';
 import { PutCommand, DynamoDBDocumentClient } from '@aws-sdk/lib-dynamodb';
-import { logger, getCurrentTimestamp } from 'ecommerce-backend-shared';
+import { logger, getCurrentTimestamp, keepAliveHandler } from 'ecommerce-backend-shared';
 import * as crypto from 'crypto';
 
-const secretsClient = new SecretsManagerClient({});
-const dynamoClient = DynamoDBDocumentClient.from(new DynamoDBClient({}));
+const secretsClient = new SecretsManagerClient({ requestHandler: keepAliveHandler() });
+const dynamoClient = DynamoDBDocumentClient.from(
+  new DynamoDBClient({ requestHandler: keepAliveHandler() })
+);
 const ADMIN_SESSIONS_TABLE = process.env.ADMIN_SESSIONS_TABLE_NAME!;
 
 // Cache credentials to avoid repeated Secrets Manager calls
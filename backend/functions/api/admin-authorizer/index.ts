@@ -1,8 +1,16 @@
 import { APIGatewayTokenAuthorizerHandler, APIGatewayAuthorizerResult } from 'aws-lambda';
 import { DynamoDBClient } from '@aws-sdk/client-dynamodb';
 import { GetCommand, DynamoDBDocumentClient } from '@aws-sdk/lib-dynamodb';
+import { Agent } from 'https';
 
-const dynamoClient = DynamoDBDocumentClient.from(new DynamoDBClient({}));
+// This function deploys without the shared layer, so the keep-alive agent
+// is declared inline (the SDK builds its handler from these options)
+// rather than imported from ecommerce-backend-shared
+const dynamoClient = DynamoDBDocumentClient.from(
+  new DynamoDBClient({
+    requestHandler: { httpsAgent: new Agent({ keepAlive: true, maxSockets: 50 }) },
+  })
+);
 const ADMIN_SESSIONS_TABLE = process.env.ADMIN_SESSIONS_TABLE_NAME!;
 
 interface AdminSession {
@@ -3,6 +3,7 @@ import Stripe from 'stripe';
 import { SecretsManagerClient, GetSecretValueCommand } from '@aws-sdk/client-secrets-manager';
 import {
   getStripeClient,
+  keepAliveHandler,
   OrderRepository,
   logger,
   getCurrentTimestamp,
@@ -10,7 +11,10 @@ import {
 import { SFNClient, StartExecutionCommand } from '@aws-sdk/client-sfn';
 
 const orderRepo = new OrderRepository();
-const sfnClient = new SFNClient({ region: process.env.AWS_REGION || 'us-east-2' });
+const sfnClient = new SFNClient({
+  region: process.env.AWS_REGION || 'us-east-2',
+  requestHandler: keepAliveHandler(),
+});
 const STATE_MACHINE_ARN = process.env.STATE_MACHINE_ARN!;
 
 // Cache webhook secret to avoid fetching on every invocation
@@ -27,6 +31,7 @@ async function getWebhookSecret(): Promise<string | null> {
   try {
     const secretsManager = new SecretsManagerClient({
       region: process.env.AWS_REGION || 'us-east-2',
+      requestHandler: keepAliveHandler(),
     });
 
     const response = await secretsManager.send(
@@ -8,6 +8,7 @@ import {
   getCurrentTimestamp,
   sendAbandonedCartReminderEmail,
   AbandonedCartReminderData,
+  keepAliveHandler,
 } from 'ecommerce-backend-shared';
 
 const orderRepo = new OrderRepository();
@@ -164,6 +165,7 @@ async function getReservedOrders(): Promise<Order[]> {
 
     const client = DynamoDBDocumentClient.from(new DynamoDBClient({
       region: process.env.AWS_REGION || 'us-east-2',
+      requestHandler: keepAliveHandler(),
     }));
 
     const tableName = process.env.ORDERS_TABLE_NAME;
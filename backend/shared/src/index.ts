@@ -30,6 +30,8 @@ export {
   LogLevel,
 } from './utils/logger';
 
+export { httpsAgent, keepAliveHandler } from './utils/http-handler';
+
 export {
   ValidationError,
   validateEmail,
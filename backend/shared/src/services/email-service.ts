@@ -1,5 +1,6 @@
 import { SESClient, SendEmailCommand } from '@aws-sdk/client-ses';
 import { logger } from '../utils/logger';
+import { keepAliveHandler } from '../utils/http-handler';
 import { Order } from '../types';
 
 /**
@@ -17,6 +18,7 @@ function getSESClient(): SESClient {
   if (!sesClient) {
     sesClient = new SESClient({
       region: process.env.AWS_REGION || 'us-east-2',
+      requestHandler: keepAliveHandler(),
     });
   }
   return sesClient;
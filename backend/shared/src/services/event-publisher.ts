@@ -1,5 +1,6 @@
 import { EventBridgeClient, PutEventsCommand } from '@aws-sdk/client-eventbridge';
 import { logger } from '../utils/logger';
+import { keepAliveHandler } from '../utils/http-handler';
 import { Order, Inventory } from '../types';
 
 /**
@@ -24,6 +25,7 @@ export class EventPublisher {
   constructor() {
     this.client = new EventBridgeClient({
       region: process.env.AWS_REGION || 'us-east-2',
+      requestHandler: keepAliveHandler(),
     });
     this.eventBusName = process.env.EVENT_BUS_NAME || 'ecommerce-events';
   }
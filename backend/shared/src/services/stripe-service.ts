@@ -1,6 +1,7 @@
-import Stripe from 'stripe';
+import type Stripe from 'stripe';
 import { SecretsManagerClient, GetSecretValueCommand } from '@aws-sdk/client-secrets-manager';
 import { logger } from '../utils/logger';
+import { keepAliveHandler } from '../utils/http-handler';
 
 /**
  * Stripe Service
@@ -20,9 +21,15 @@ export async function getStripeClient(): Promise<Stripe> {
   }
 
   try {
+    // Load the Stripe module lazily: the shared index re-exports this
+    // service into every function, and the eager require cost ~100ms of
+    // init for handlers that never touch payments
+    const StripeCtor = (await import('stripe')).default;
+
     // Get secret from Secrets Manager
     const secretsManager = new SecretsManagerClient({
       region: process.env.AWS_REGION || 'us-east-2',
+      requestHandler: keepAliveHandler(),
     });
 
     const response = await secretsManager.send(
@@ -37,7 +44,7 @@ export async function getStripeClient(): Promise<Stripe> {
     }
 
     // Initialize Stripe client
-    stripeClient = new Stripe(secretKey, {
+    stripeClient = new StripeCtor(secretKey, {
       apiVersion: '2023-10-16', // Stripe API version
       typescript: true,
     });
@@ -8,6 +8,7 @@ import {
   QueryCommand,
   ScanCommand,
 } from '@aws-sdk/lib-dynamodb';
+import { keepAliveHandler } from './http-handler';
 
 /**
  * DynamoDB Client Configuration
@@ -20,6 +21,7 @@ class DynamoDBClientManager {
     if (!this.instance) {
       const client = new DynamoDBClient({
         region: process.env.AWS_REGION || 'us-east-2',
+        requestHandler: keepAliveHandler(),
       });
 
       this.instance = DynamoDBDocumentClient.from(client, {
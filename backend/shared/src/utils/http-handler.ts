@@ -0,0 +1,22 @@
+import { Agent } from 'https';
+import { NodeHttpHandler } from '@smithy/node-http-handler';
+
+/**
+ * Shared HTTP handler for AWS SDK v3 clients
+ *
+ * AWS_NODEJS_CONNECTION_REUSE_ENABLED only affects SDK v2; v3 clients need
+ * an explicit keep-alive agent. Without it every DynamoDB/SES/Secrets
+ * Manager call pays a fresh TCP+TLS handshake (~30-50ms). One singleton
+ * agent is shared by all clients so warm invocations reuse sockets.
+ */
+
+// maxSockets 50 matches the AWS SDK default
+export const httpsAgent = new Agent({ keepAlive: true, maxSockets: 50 });
+
+/**
+ * Build a request handler wired to the shared keep-alive agent.
+ * Pass as `requestHandler` when constructing any SDK v3 client.
+ */
+export function keepAliveHandler(): NodeHttpHandler {
+  return new NodeHttpHandler({ httpsAgent });
+}
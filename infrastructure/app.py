@@ -1,16 +1,110 @@
 #!/usr/bin/env python3
+import glob
+import hashlib
+import importlib.metadata
 import os
+import shutil
+import sys
+
 import aws_cdk as cdk
 
-from infrastructure.stacks import (
-    DatabaseStack,
-    LambdaStack,
-    ApiGatewayStack,
-    StepFunctionsStack,
-    MonitoringStack,
-    FrontendStack,
+# Stack classes are resolved inside the factories below; the stacks package
+# imports lazily, so only the selected stacks' modules (and their aws_cdk
+# submodules) are ever loaded.
+from infrastructure import stacks as stack_classes
+
+# Environment variables the stacks (or this file) read during synthesis;
+# any change to one of these must produce a different cloud assembly
+_SYNTH_ENV_VARS = (
+    "CDK_DEFAULT_ACCOUNT",
+    "CDK_DEFAULT_REGION",
+    "STACKS",
+    "FRONTEND_ORIGIN",
+    "ADMIN_AUTHZ_TTL_MIN",
+    "EMIT_EXAMPLES",
+    "ALARM_EMAIL",
+)
+
+# Libraries whose installed version shapes the synthesized templates; an
+# upgrade must invalidate the cache even with identical sources
+_SYNTH_LIBRARIES = ("aws-cdk-lib", "constructs", "jsii")
+
+# Directories whose contents become CDK assets (built by build-lambdas.sh);
+# staleness is tracked make-style via path/size/mtime rather than hashing
+# every node_modules byte
+_ASSET_DIR_GLOBS = (
+    os.path.join("..", "backend", "functions", "*", "*", "dist"),
+    "lambda-layer",
+    "lambda-layer-deps",
 )
 
+
+def _synth_cache_dir():
+    """
+    Locate the cloud-assembly cache entry for the current inputs.
+
+    Opt-in via CDK_SYNTH_CACHE=1: the key covers every input the assembly
+    depends on - infrastructure sources, CDK context (CLI -c values arrive
+    in CDK_CONTEXT_JSON, plus cdk.json/cdk.context.json), the env vars the
+    stacks consume, the installed CDK library versions, and the Lambda
+    asset directories, so a rebuild via build-lambdas.sh or a library
+    upgrade misses the cache. On a hit the stored assembly is copied into
+    cdk.out and synthesis is skipped entirely.
+    """
+    if os.getenv("CDK_SYNTH_CACHE") != "1":
+        return None
+
+    hasher = hashlib.blake2b()
+    app_dir = os.path.dirname(os.path.abspath(__file__))
+    sources = sorted(
+        glob.glob(os.path.join(app_dir, "infrastructure", "**", "*.py"), recursive=True)
+    )
+    sources.append(os.path.abspath(__file__))
+    for path in ("cdk.json", "cdk.context.json"):
+        path = os.path.join(app_dir, path)
+        if os.path.isfile(path):
+            sources.append(path)
+    for path in sources:
+        with open(path, "rb") as f:
+            hasher.update(f.read())
+
+    # CLI context (-c key=value) is handed to the app via CDK_CONTEXT_JSON
+    hasher.update(os.getenv("CDK_CONTEXT_JSON", "").encode())
+    for name in _SYNTH_ENV_VARS:
+        hasher.update(f"{name}={os.getenv(name, '')}".encode())
+    for name in _SYNTH_LIBRARIES:
+        hasher.update(f"{name}=={importlib.metadata.version(name)}".encode())
+
+    # Asset directory state: file list plus sizes and mtimes is enough to
+    # notice a rebuild without re-reading megabytes of node_modules
+    for dir_glob in _ASSET_DIR_GLOBS:
+        for asset_dir in sorted(glob.glob(os.path.join(app_dir, dir_glob))):
+            for root, dirs, files in os.walk(asset_dir):
+                dirs.sort()
+                for name in sorted(files):
+                    path = os.path.join(root, name)
+                    stat = os.stat(path)
+                    hasher.update(
+                        f"{os.path.relpath(path, app_dir)}"
+                        f":{stat.st_size}:{stat.st_mtime_ns}".encode()
+                    )
+
+    cache_root = os.path.join(
+        os.path.expanduser(os.getenv("XDG_CACHE_HOME", "~/.cache")), "cdk-synth"
+    )
+    return os.path.join(cache_root, hasher.hexdigest())
+
+
+_outdir = os.getenv("CDK_OUTDIR", "cdk.out")
+_cache_dir = _synth_cache_dir()
+
+if _cache_dir and os.path.isdir(_cache_dir):
+    # Cache hit: reuse the previously synthesized cloud assembly
+    if os.path.isdir(_outdir):
+        shutil.rmtree(_outdir)
+    shutil.copytree(_cache_dir, _outdir)
+    sys.exit(0)
+
 app = cdk.App()
 
 # env config
@@ -19,76 +113,170 @@ env = cdk.Environment(
     region=os.getenv('CDK_DEFAULT_REGION', 'us-east-2')
 )
 
-# Database Stack - DynamoDB
-database_stack = DatabaseStack(
-    app,
-    "EcommerceDatabaseStack",
-    env=env,
-    description="DynamoDB tables for e-commerce order fulfillment system"
-)
+# Built stacks, keyed by stack name (populated below)
+stacks = {}
 
-# Lambda Stack
-lambda_stack = LambdaStack(
-    app,
-    "EcommerceLambdaStack",
-    database_stack=database_stack,
-    env=env,
-    description="Lambda functions for API and event processing"
-)
 
-# API Gateway Stack - REST API
-api_gateway_stack = ApiGatewayStack(
-    app,
-    "EcommerceApiGatewayStack",
-    lambda_stack=lambda_stack,
-    env=env,
-    description="API Gateway REST API for order management"
-)
+def _synthesizer():
+    """
+    Per-stack synthesizer (synthesizers cannot be shared between stacks).
+    Skipping the bootstrap-version rule drops a CFN rule + SSM parameter
+    lookup per stack; the account is bootstrapped once and stays that way.
+    """
+    return cdk.DefaultStackSynthesizer(generate_bootstrap_version_rule=False)
 
-# Step Functions Stack - Saga Orchestrator
-stepfunctions_stack = StepFunctionsStack(
-    app,
-    "EcommerceStepFunctionsStack",
-    env=env,
-    description="Step Functions state machine for order fulfillment saga"
-)
+# Tags applied to every stack (per stack rather than app-wide, so the tag
+# walk is scoped to the subtrees that were actually instantiated)
+COMMON_TAGS = {
+    "Project": "EcommerceOrderFulfillment",
+    "Environment": "Development",
+    "ManagedBy": "CDK",
+}
 
-# Monitoring Stack - CloudWatch Dashboards & Alarms
-monitoring_stack = MonitoringStack(
-    app,
-    "EcommerceMonitoringStack",
-    lambda_stack=lambda_stack,
-    api_gateway_stack=api_gateway_stack,
-    stepfunctions_stack=stepfunctions_stack,
-    alarm_email=os.getenv('ALARM_EMAIL'),  # Optional: Set ALARM_EMAIL env var for notifications
-    env=env,
-    description="CloudWatch dashboards, alarms, and observability"
-)
+# Stack factories - stacks are only instantiated when selected (plus their
+# declared dependencies), so `cdk diff EcommerceDatabaseStack` doesn't pay
+# the construct-tree build cost of the other five stacks.
+STACK_FACTORIES = {
+    "EcommerceDatabaseStack": lambda: stack_classes.DatabaseStack(
+        app,
+        "EcommerceDatabaseStack",
+        env=env,
+        synthesizer=_synthesizer(),
+        description="DynamoDB tables for e-commerce order fulfillment system",
+    ),
+    "EcommerceLambdaStack": lambda: stack_classes.LambdaStack(
+        app,
+        "EcommerceLambdaStack",
+        database_stack=stacks["EcommerceDatabaseStack"],
+        env=env,
+        synthesizer=_synthesizer(),
+        description="Lambda functions for API and event processing",
+    ),
+    "EcommerceApiGatewayStack": lambda: stack_classes.ApiGatewayStack(
+        app,
+        "EcommerceApiGatewayStack",
+        lambda_stack=stacks["EcommerceLambdaStack"],
+        env=env,
+        synthesizer=_synthesizer(),
+        description="API Gateway REST API for order management",
+    ),
+    "EcommerceStepFunctionsStack": lambda: stack_classes.StepFunctionsStack(
+        app,
+        "EcommerceStepFunctionsStack",
+        lambda_stack=stacks["EcommerceLambdaStack"],
+        env=env,
+        synthesizer=_synthesizer(),
+        description="Step Functions state machine for order fulfillment saga",
+    ),
+    "EcommerceMonitoringStack": lambda: stack_classes.MonitoringStack(
+        app,
+        "EcommerceMonitoringStack",
+        lambda_stack=stacks["EcommerceLambdaStack"],
+        api_gateway_stack=stacks["EcommerceApiGatewayStack"],
+        stepfunctions_stack=stacks["EcommerceStepFunctionsStack"],
+        alarm_email=os.getenv('ALARM_EMAIL'),  # Optional: Set ALARM_EMAIL env var for notifications
+        env=env,
+        synthesizer=_synthesizer(),
+        description="CloudWatch dashboards, alarms, and observability",
+    ),
+    "EcommerceFrontendStack": lambda: stack_classes.FrontendStack(
+        app,
+        "EcommerceFrontendStack",
+        # A context-provided URL (-c apiUrl=https://...) is a plain string,
+        # letting the frontend deploy with no Fn::ImportValue coupling at
+        # all (cdk deploy --all --concurrency N); otherwise fall back to
+        # importing the exported URL
+        api_url=app.node.try_get_context("apiUrl")
+        or cdk.Fn.import_value("EcommerceApiUrl"),
+        env=env,
+        synthesizer=_synthesizer(),
+        description="S3 + CloudFront hosting for React frontend",
+    ),
+}
+
+# Deployment dependencies between stacks
+DEPS = {
+    "EcommerceDatabaseStack": set(),
+    "EcommerceLambdaStack": {"EcommerceDatabaseStack"},
+    "EcommerceApiGatewayStack": {"EcommerceLambdaStack"},
+    # StepFunctions receives the task Lambda functions directly
+    "EcommerceStepFunctionsStack": {"EcommerceLambdaStack"},
+    # Monitoring must be deployed after all other stacks
+    "EcommerceMonitoringStack": {
+        "EcommerceLambdaStack",
+        "EcommerceApiGatewayStack",
+        "EcommerceStepFunctionsStack",
+    },
+    # Frontend reads the API URL via Fn.import_value, which decouples the
+    # templates but not deploy order - CloudFormation does not sequence
+    # stack deploys, so on a fresh account the frontend must still wait
+    # for the export to exist. A context-provided URL (-c apiUrl=...)
+    # carries no import, so only then can the frontend deploy standalone.
+    "EcommerceFrontendStack": (
+        set()
+        if app.node.try_get_context("apiUrl")
+        else {"EcommerceApiGatewayStack"}
+    ),
+}
 
-# Frontend Stack - S3 + CloudFront for React App
-frontend_stack = FrontendStack(
-    app,
+# Topological build order (dependencies before dependents)
+BUILD_ORDER = [
+    "EcommerceDatabaseStack",
+    "EcommerceLambdaStack",
+    "EcommerceApiGatewayStack",
+    "EcommerceStepFunctionsStack",
+    "EcommerceMonitoringStack",
     "EcommerceFrontendStack",
-    api_url=api_gateway_stack.api.url,  # Pass API URL to frontend
-    env=env,
-    description="S3 + CloudFront hosting for React frontend"
-)
+]
+
+
+def _selected_stacks():
+    """
+    Resolve which stacks to instantiate from the STACKS env var
+    (comma-separated stack names). Falls back to all stacks when unset.
+    Always includes the transitive dependencies of the requested stacks.
+    """
+    requested = os.getenv("STACKS")
+    if not requested:
+        return set(BUILD_ORDER)
+
+    selected = {name.strip() for name in requested.split(",") if name.strip()}
+    unknown = selected - set(BUILD_ORDER)
+    if unknown:
+        raise ValueError(
+            f"Unknown stack(s) in STACKS: {', '.join(sorted(unknown))}. "
+            f"Valid names: {', '.join(BUILD_ORDER)}"
+        )
+
+    # Transitive closure over dependencies
+    pending = list(selected)
+    while pending:
+        for dep in DEPS[pending.pop()]:
+            if dep not in selected:
+                selected.add(dep)
+                pending.append(dep)
+    return selected
+
+
+selected = _selected_stacks()
+
+for name in BUILD_ORDER:
+    if name in selected:
+        stacks[name] = STACK_FACTORIES[name]()
+        for key, value in COMMON_TAGS.items():
+            cdk.Tags.of(stacks[name]).add(key, value)
+
+# Add dependencies (only between stacks that were instantiated)
+for name, deps in DEPS.items():
+    if name in stacks:
+        for dep in deps:
+            if dep in stacks:
+                stacks[name].add_dependency(stacks[dep])
+
+app.synth()
 
-# Add dependencies
-lambda_stack.add_dependency(database_stack)
-api_gateway_stack.add_dependency(lambda_stack)
-# StepFunctions must be deployed after Lambda (needs Lambda function exports)
-stepfunctions_stack.add_dependency(lambda_stack)
-# Monitoring must be deployed after all other stacks
-monitoring_stack.add_dependency(lambda_stack)
-monitoring_stack.add_dependency(api_gateway_stack)
-monitoring_stack.add_dependency(stepfunctions_stack)
-# Frontend must be deployed after API Gateway (needs API URL)
-frontend_stack.add_dependency(api_gateway_stack)
-
-# Add tags to all resources
-cdk.Tags.of(app).add("Project", "EcommerceOrderFulfillment")
-cdk.Tags.of(app).add("Environment", "Development")
-cdk.Tags.of(app).add("ManagedBy", "CDK")
-
-app.synth()
\ No newline at end of file
+if _cache_dir:
+    # Cache miss: store the fresh assembly for the next invocation
+    shutil.rmtree(_cache_dir, ignore_errors=True)
+    os.makedirs(os.path.dirname(_cache_dir), exist_ok=True)
+    shutil.copytree(_outdir, _cache_dir)
@@ -1,16 +1,35 @@
-from .database_stack import DatabaseStack
-from .event_stack import EventStack
-from .lambda_stack import LambdaStack
-from .api_gateway_stack import ApiGatewayStack
-from .stepfunctions_stack import EcommerceStepFunctionsStack as StepFunctionsStack
-from .monitoring_stack import MonitoringStack
-from .frontend_stack import FrontendStack
+import importlib
+
+# Map of exported stack class -> (module, attribute). Stack modules are
+# imported lazily (PEP 562) so entrypoints that only need a subset of the
+# stacks never pay the aws_cdk submodule import cost of the rest.
+_STACK_EXPORTS = {
+    "DatabaseStack": ("database_stack", "DatabaseStack"),
+    "EventStack": ("event_stack", "EventStack"),
+    "LambdaStack": ("lambda_stack", "LambdaStack"),
+    "ApiGatewayStack": ("api_gateway_stack", "ApiGatewayStack"),
+    "StepFunctionsStack": ("stepfunctions_stack", "EcommerceStepFunctionsStack"),
+    "MonitoringStack": ("monitoring_stack", "MonitoringStack"),
+    "FrontendStack": ("frontend_stack", "FrontendStack"),
+}
 
 __all__ = [
     "DatabaseStack",
+    "EventStack",
     "LambdaStack",
     "ApiGatewayStack",
     "StepFunctionsStack",
     "MonitoringStack",
     "FrontendStack",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    try:
+        module_name, attr_name = _STACK_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    module = importlib.import_module(f".{module_name}", __name__)
+    attr = getattr(module, attr_name)
+    globals()[name] = attr  # cache so the import only happens once
+    return attr
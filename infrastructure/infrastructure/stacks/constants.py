@@ -0,0 +1,11 @@
+"""
+Cross-stack constants.
+
+LambdaStack grants/points create_order and stripe_webhook at the saga by
+constructing its ARN from this name, and StepFunctionsStack names the
+state machine with it. A direct construct reference would be circular
+(StepFunctionsStack already consumes LambdaStack's task functions), so
+the name is the single shared source of truth instead.
+"""
+
+SAGA_STATE_MACHINE_NAME = "OrderFulfillmentSaga"
@@ -22,19 +22,13 @@ class DatabaseStack(Stack):
     def __init__(self, scope: Construct, construct_id: str, **kwargs) -> None:
         super().__init__(scope, construct_id, **kwargs)
 
-        # Orders Table
-        self.orders_table = dynamodb.Table(
-            self,
+        # Orders Table. The stream carries only the new image: no consumer
+        # diffs against the old one, and NEW_AND_OLD_IMAGES doubles the
+        # stream record bytes written on every order update.
+        self.orders_table = self._make_table(
             "OrdersTable",
-            partition_key=dynamodb.Attribute(
-                name="PK", type=dynamodb.AttributeType.STRING
-            ),
-            billing_mode=dynamodb.BillingMode.PAY_PER_REQUEST,
-            removal_policy=RemovalPolicy.DESTROY,
-            point_in_time_recovery_specification=dynamodb.PointInTimeRecoverySpecification(
-                point_in_time_recovery_enabled=True
-            ),
-            stream=dynamodb.StreamViewType.NEW_AND_OLD_IMAGES,
+            pitr=True,
+            stream=dynamodb.StreamViewType.NEW_IMAGE,
         )
 
         # GSI for querying orders by customer
@@ -62,18 +56,7 @@ class DatabaseStack(Stack):
         )
 
         # Products Table
-        self.products_table = dynamodb.Table(
-            self,
-            "ProductsTable",
-            partition_key=dynamodb.Attribute(
-                name="PK", type=dynamodb.AttributeType.STRING
-            ),
-            billing_mode=dynamodb.BillingMode.PAY_PER_REQUEST,
-            removal_policy=RemovalPolicy.DESTROY,
-            point_in_time_recovery_specification=dynamodb.PointInTimeRecoverySpecification(
-                point_in_time_recovery_enabled=True
-            ),
-        )
+        self.products_table = self._make_table("ProductsTable", pitr=True)
 
         # GSI for querying products by category
         self.products_table.add_global_secondary_index(
@@ -87,17 +70,15 @@ class DatabaseStack(Stack):
             projection_type=dynamodb.ProjectionType.ALL,
         )
 
-        # Inventory Table (with optimistic locking)
-        self.inventory_table = dynamodb.Table(
-            self,
+        # Inventory Table (with optimistic locking). Highest-write table in
+        # the system (every order reserves/releases stock), so pre-warm the
+        # write path above the on-demand default to absorb order bursts
+        # without the slow on-demand capacity ramp throttling BatchWrites.
+        self.inventory_table = self._make_table(
             "InventoryTable",
-            partition_key=dynamodb.Attribute(
-                name="PK", type=dynamodb.AttributeType.STRING
-            ),
-            billing_mode=dynamodb.BillingMode.PAY_PER_REQUEST,
-            removal_policy=RemovalPolicy.DESTROY,
-            point_in_time_recovery_specification=dynamodb.PointInTimeRecoverySpecification(
-                point_in_time_recovery_enabled=True
+            pitr=True,
+            warm_throughput=dynamodb.WarmThroughput(
+                write_units_per_second=8000,
             ),
         )
 
@@ -114,25 +95,64 @@ class DatabaseStack(Stack):
         )
 
         # Idempotency Table (for payment deduplication)
-        self.idempotency_table = dynamodb.Table(
-            self,
+        self.idempotency_table = self._make_table(
             "IdempotencyTable",
-            partition_key=dynamodb.Attribute(
-                name="idempotencyKey", type=dynamodb.AttributeType.STRING
-            ),
-            billing_mode=dynamodb.BillingMode.PAY_PER_REQUEST,
-            removal_policy=RemovalPolicy.DESTROY,
-            time_to_live_attribute="expiresAt",  # Auto-cleanup old keys
+            pk="idempotencyKey",
+            ttl="expiresAt",  # Auto-cleanup old keys
         )
 
         # Admin Sessions Table (for authentication tokens)
-        self.admin_sessions_table = dynamodb.Table(
-            self,
+        self.admin_sessions_table = self._make_table(
             "AdminSessionsTable",
+            pk="sessionToken",
+            ttl="expiresAt",  # Auto-cleanup expired sessions
+        )
+
+    def _make_table(
+        self, construct_id, pk="PK", pitr=False, stream=None, ttl=None,
+        warm_throughput=None,
+    ):
+        """
+        Create a table with the stack-wide defaults (on-demand billing,
+        DESTROY removal policy, string partition key).
+
+        Durability settings follow the `stage` context value (`-c
+        stage=prod`): prod tables get PITR, deletion protection, and a
+        RETAIN removal policy; dev tables skip PITR and stay cheap to
+        destroy/recreate.
+
+        Note on the status-createdAt-index GSI: partitioning on raw
+        `status` is low-cardinality and can hot-spot under sustained write
+        load. The standard fix is a sharded key (status#hash(orderId) % N)
+        with fan-out queries, but every current consumer (admin order
+        listing, abandoned-cart cleanup) queries `status` directly, so
+        re-keying the GSI is a coordinated backend+infra migration rather
+        than a drop-in change here.
+        """
+        stage = self.node.try_get_context("stage") or "dev"
+        is_prod = stage == "prod"
+
+        kwargs = {}
+        if pitr and is_prod:
+            kwargs["point_in_time_recovery_specification"] = (
+                dynamodb.PointInTimeRecoverySpecification(
+                    point_in_time_recovery_enabled=True
+                )
+            )
+        if stream is not None:
+            kwargs["stream"] = stream
+        if ttl is not None:
+            kwargs["time_to_live_attribute"] = ttl
+        if warm_throughput is not None:
+            kwargs["warm_throughput"] = warm_throughput
+        return dynamodb.Table(
+            self,
+            construct_id,
             partition_key=dynamodb.Attribute(
-                name="sessionToken", type=dynamodb.AttributeType.STRING
+                name=pk, type=dynamodb.AttributeType.STRING
             ),
             billing_mode=dynamodb.BillingMode.PAY_PER_REQUEST,
-            removal_policy=RemovalPolicy.DESTROY,
-            time_to_live_attribute="expiresAt",  # Auto-cleanup expired sessions
+            removal_policy=RemovalPolicy.RETAIN if is_prod else RemovalPolicy.DESTROY,
+            deletion_protection=is_prod,
+            **kwargs,
         )
@@ -7,6 +7,7 @@ from aws_cdk import (
     Duration,
     CfnOutput,
     RemovalPolicy,
+    Size,
     aws_s3 as s3,
     aws_cloudfront as cloudfront,
     aws_cloudfront_origins as origins,
@@ -14,7 +15,7 @@ from aws_cdk import (
     aws_iam as iam,
 )
 from constructs import Construct
-import os
+from pathlib import Path
 
 
 class FrontendStack(Stack):
@@ -43,7 +44,7 @@ class FrontendStack(Stack):
             self,
             "WebsiteBucket",
             bucket_name=None,  # Auto-generate unique name
-            public_read_access=False,  # CloudFront will access via OAI
+            public_read_access=False,  # CloudFront will access via OAC
             block_public_access=s3.BlockPublicAccess.BLOCK_ALL,
             removal_policy=RemovalPolicy.DESTROY,  # Delete bucket on stack deletion
             auto_delete_objects=True,  # Delete objects when bucket is deleted
@@ -51,54 +52,35 @@ class FrontendStack(Stack):
             encryption=s3.BucketEncryption.S3_MANAGED,
         )
 
-        # ===== CloudFront Origin Access Identity =====
-        # Allows CloudFront to access S3 bucket without making it public
-        origin_access_identity = cloudfront.OriginAccessIdentity(
-            self,
-            "WebsiteOAI",
-            comment="OAI for frontend S3 bucket",
+        # ===== CloudFront Distribution =====
+        # Origin Access Control: CloudFront signs origin requests with
+        # SigV4 and the bucket policy is generated automatically (replaces
+        # the legacy OAI + grant_read pattern)
+        s3_origin = origins.S3BucketOrigin.with_origin_access_control(
+            self.website_bucket
         )
 
-        # Grant CloudFront read access to S3 bucket
-        self.website_bucket.grant_read(origin_access_identity)
-
-        # ===== CloudFront Distribution =====
-        # Create S3 origin for CloudFront
-        s3_origin = origins.S3Origin(
-            self.website_bucket,
-            origin_access_identity=origin_access_identity,
+        # All three behaviors (default, /assets/*, /vite.svg) are identical,
+        # so build the immutable options struct once and share it by
+        # reference instead of allocating three copies per synth
+        std_behavior = cloudfront.BehaviorOptions(
+            origin=s3_origin,
+            viewer_protocol_policy=cloudfront.ViewerProtocolPolicy.REDIRECT_TO_HTTPS,
+            allowed_methods=cloudfront.AllowedMethods.ALLOW_GET_HEAD_OPTIONS,
+            cached_methods=cloudfront.CachedMethods.CACHE_GET_HEAD_OPTIONS,
+            cache_policy=cloudfront.CachePolicy.CACHING_OPTIMIZED,
+            compress=True,  # Enable gzip/brotli compression
         )
 
         self.distribution = cloudfront.Distribution(
             self,
             "WebsiteDistribution",
-            default_behavior=cloudfront.BehaviorOptions(
-                origin=s3_origin,
-                viewer_protocol_policy=cloudfront.ViewerProtocolPolicy.REDIRECT_TO_HTTPS,
-                allowed_methods=cloudfront.AllowedMethods.ALLOW_GET_HEAD_OPTIONS,
-                cached_methods=cloudfront.CachedMethods.CACHE_GET_HEAD_OPTIONS,
-                cache_policy=cloudfront.CachePolicy.CACHING_OPTIMIZED,
-                compress=True,  # Enable gzip/brotli compression
-            ),
+            default_behavior=std_behavior,
             # Separate behavior for static assets (CSS, JS, images)
             # No error responses for assets - let them 404 naturally
             additional_behaviors={
-                "/assets/*": cloudfront.BehaviorOptions(
-                    origin=s3_origin,
-                    viewer_protocol_policy=cloudfront.ViewerProtocolPolicy.REDIRECT_TO_HTTPS,
-                    allowed_methods=cloudfront.AllowedMethods.ALLOW_GET_HEAD_OPTIONS,
-                    cached_methods=cloudfront.CachedMethods.CACHE_GET_HEAD_OPTIONS,
-                    cache_policy=cloudfront.CachePolicy.CACHING_OPTIMIZED,
-                    compress=True,
-                ),
-                "/vite.svg": cloudfront.BehaviorOptions(
-                    origin=s3_origin,
-                    viewer_protocol_policy=cloudfront.ViewerProtocolPolicy.REDIRECT_TO_HTTPS,
-                    allowed_methods=cloudfront.AllowedMethods.ALLOW_GET_HEAD_OPTIONS,
-                    cached_methods=cloudfront.CachedMethods.CACHE_GET_HEAD_OPTIONS,
-                    cache_policy=cloudfront.CachePolicy.CACHING_OPTIMIZED,
-                    compress=True,
-                ),
+                "/assets/*": std_behavior,
+                "/vite.svg": std_behavior,
             },
             default_root_object="index.html",
             # SPA routing: serve index.html for 404s (client-side routing)
@@ -121,34 +103,67 @@ class FrontendStack(Stack):
         )
 
         # ===== Deploy Frontend Files to S3 =====
-        # Check if frontend build directory exists
-        # Path is relative to infrastructure/infrastructure/stacks/ -> need to go up 3 levels
-        frontend_build_path = os.path.join(
-            os.path.dirname(__file__),  # stacks/
-            "../../../frontend/dist"     # up 3 levels, then into frontend/dist
-        )
-        frontend_build_path = os.path.abspath(frontend_build_path)
+        # Path is relative to infrastructure/infrastructure/stacks/ -> need
+        # to go up 3 levels; resolve() folds the join/abspath/exists trio
+        # into a single realpath + stat
+        self.frontend_build_path = (
+            Path(__file__).resolve().parent / "../../../frontend/dist"
+        ).resolve()
 
         # Only deploy if build directory exists (prevents CDK synth errors)
-        if os.path.exists(frontend_build_path):
+        if self.frontend_build_path.is_dir():
+            website_source = s3_deployment.Source.asset(
+                str(self.frontend_build_path)
+            )
+
+            # Two deployments so Cache-Control can differ per object class.
+            # Vite emits content-hashed filenames under /assets/, so new
+            # bundles are new keys: they upload with a one-year immutable
+            # TTL and need no invalidation. prune respects the exclude, so
+            # index.html survives this sync.
             s3_deployment.BucketDeployment(
                 self,
                 "DeployWebsite",
-                sources=[s3_deployment.Source.asset(frontend_build_path)],
+                sources=[website_source],
                 destination_bucket=self.website_bucket,
-                distribution=self.distribution,
-                distribution_paths=["/*"],  # Invalidate all CloudFront cache on deployment
-                memory_limit=512,  # MB for the deployment Lambda
+                exclude=["index.html"],
+                cache_control=[
+                    s3_deployment.CacheControl.from_string(
+                        "public, max-age=31536000, immutable"
+                    )
+                ],
+                # Lambda CPU scales with memory; 1769 MB = one full vCPU,
+                # which roughly halves the unzip+sync time of the deploy
+                memory_limit=1769,
+                ephemeral_storage_size=Size.gibibytes(2),  # Headroom over the 512 MB /tmp default
+                use_efs=False,
                 prune=True,  # Remove old files from S3
             )
 
+            # The entry document must never be cached by browsers - a stale
+            # SPA shell would reference pruned hashed bundles - and only it
+            # (plus the root that serves it) needs the edge invalidation
+            s3_deployment.BucketDeployment(
+                self,
+                "DeployWebsiteIndex",
+                sources=[website_source],
+                destination_bucket=self.website_bucket,
+                exclude=["*"],
+                include=["index.html"],
+                cache_control=[
+                    s3_deployment.CacheControl.from_string("no-cache")
+                ],
+                distribution=self.distribution,
+                distribution_paths=["/index.html", "/"],
+                prune=False,  # The assets deployment owns pruning
+            )
+
         # ===== Outputs =====
         CfnOutput(
             self,
             "WebsiteBucketName",
             value=self.website_bucket.bucket_name,
             description="S3 bucket name for frontend",
-            export_name="EcommerceFrontendBucket",
         )
 
         CfnOutput(
@@ -156,7 +171,6 @@ class FrontendStack(Stack):
             "CloudFrontURL",
             value=f"https://{self.distribution.distribution_domain_name}",
             description="CloudFront URL for frontend",
-            export_name="EcommerceFrontendUrl",
         )
 
         CfnOutput(
@@ -164,7 +178,6 @@ class FrontendStack(Stack):
             "CloudFrontDistributionId",
             value=self.distribution.distribution_id,
             description="CloudFront Distribution ID",
-            export_name="EcommerceCloudFrontDistributionId",
         )
 
         CfnOutput(
@@ -2,10 +2,11 @@
 Lambda Stack - Defines all Lambda functions for the e-commerce system
 """
 
+import os
+
 from aws_cdk import (
     Stack,
     Duration,
-    CfnOutput,
     aws_lambda as _lambda,
     aws_lambda_event_sources as lambda_event_sources,
     aws_iam as iam,
@@ -15,6 +16,58 @@ from aws_cdk import (
 )
 from constructs import Construct
 
+from .constants import SAGA_STATE_MACHINE_NAME
+
+# Asset roots anchored to this file, so synthesis works regardless of the
+# process working directory (cdk CLI, pytest, IDE test runners)
+_APP_DIR = os.path.normpath(os.path.join(os.path.dirname(__file__), "..", ".."))
+_BACKEND_FUNCTIONS_DIR = os.path.normpath(
+    os.path.join(_APP_DIR, "..", "backend", "functions")
+)
+
+# Memory is the CPU knob on Lambda, so sizes live in one table rather than
+# inline per function. Current values come from rough workload categories
+# (reads 512, writes/admin 512, CPU-bound saga steps 1024); reseed from
+# Lambda Power Tuning runs as real traffic data accumulates.
+MEMORY_PROFILES = {
+    "CreateOrderFunction": 512,
+    # 512 MB halves cold-start JS parse time on the latency-sensitive
+    # read paths vs the old 256
+    "GetOrderFunction": 512,
+    "ListProductsFunction": 256,
+    "CheckInventoryFunction": 512,
+    "StripeWebhookFunction": 512,
+    "AdminAuthFunction": 256,
+    # On the critical path of every admin request with a 5s budget:
+    # 1024 MB keeps cold-start parse time well under it
+    "AdminAuthorizerFunction": 1024,
+    "AdminListOrdersFunction": 512,
+    "AdminCancelOrderFunction": 512,
+    "AdminUpdateInventoryFunction": 512,
+    "AdminAnalyticsFunction": 512,
+    # Both saga write paths loop over line items doing conditional writes
+    # with retry/backoff - CPU-bound enough that 1024 MB cuts billed
+    # duration rather than raising cost
+    "ReserveInventoryStepFunction": 1024,
+    "ProcessPaymentStepFunction": 256,
+    "AllocateShippingStepFunction": 256,
+    "SendNotificationStepFunction": 256,
+    "CompensationHandlerFunction": 1024,
+    "CleanupAbandonedCartsFunction": 512,
+}
+
+# Dev-only files have no business in the layer zips: they inflate upload
+# time on every deploy and cold-start extraction I/O on every sandbox
+_LAYER_EXCLUDES = [
+    "**/*.map",
+    "**/*.d.ts",
+    "**/*.md",
+    "**/*.markdown",
+    "**/*.ts",
+    "**/__tests__/**",
+    "**/*.test.js",
+]
+
 
 class LambdaStack(Stack):
     """
@@ -54,14 +107,37 @@ class LambdaStack(Stack):
             shipping_queue = None
             notification_queue = None
 
-        # Create Lambda Layer for shared code
-        # need to build this first with: cd backend/shared && npm run build
-        # Then create layer structure
+        # Runtime is context-switchable (-c nodeRuntime=nodejs22.x) so a
+        # runtime A/B test or rollback is a deploy flag, not a code change
+        node_runtime = _lambda.Runtime(
+            self.node.try_get_context("nodeRuntime") or "nodejs20.x",
+            _lambda.RuntimeFamily.NODEJS,
+        )
+
+        # Create Lambda Layers for shared code
+        # need to build these first with ./build-lambdas.sh
+        # Split in two so a business-code change republishes only the small
+        # code layer; the node_modules layer is invalidated only when
+        # dependencies actually change.
+        self.deps_layer = _lambda.LayerVersion(
+            self,
+            "SharedDepsLayer",
+            code=_lambda.Code.from_asset(
+                os.path.join(_APP_DIR, "lambda-layer-deps"),
+                exclude=_LAYER_EXCLUDES,
+            ),
+            compatible_runtimes=[node_runtime],
+            compatible_architectures=[_lambda.Architecture.ARM_64],
+            description="Third-party dependencies for the shared layer",
+        )
         self.shared_layer = _lambda.LayerVersion(
             self,
             "SharedCodeLayer",
-            code=_lambda.Code.from_asset("lambda-layer"),
-            compatible_runtimes=[_lambda.Runtime.NODEJS_20_X],
+            code=_lambda.Code.from_asset(
+                os.path.join(_APP_DIR, "lambda-layer"), exclude=_LAYER_EXCLUDES
+            ),
+            compatible_runtimes=[node_runtime],
+            compatible_architectures=[_lambda.Architecture.ARM_64],
             description="Shared data layer code (repositories, services, types)",
         )
 
@@ -72,154 +148,295 @@ class LambdaStack(Stack):
             "PRODUCTS_TABLE_NAME": products_table.table_name,
             "INVENTORY_TABLE_NAME": inventory_table.table_name,
             "IDEMPOTENCY_TABLE_NAME": idempotency_table.table_name,
-            "AWS_NODEJS_CONNECTION_REUSE_ENABLED": "1",  # Reuse HTTP connections
-            "LOG_LEVEL": "INFO",
+            # SDK v2 only; v3 clients use the shared keep-alive agent in
+            # the layer (utils/http-handler). Kept for any v2 stragglers.
+            "AWS_NODEJS_CONNECTION_REUSE_ENABLED": "1",
+            # WARN by default - INFO logging on hot paths costs synchronous
+            # PutLogEvents time and ingestion dollars. Override per deploy
+            # with -c logLevel=INFO (or DEBUG) when diagnosing.
+            "LOG_LEVEL": self.node.try_get_context("logLevel") or "WARN",
         }
         
         if event_bus:
             common_env["EVENT_BUS_NAME"] = event_bus.event_bus_name
 
-        # ===== API Lambda Functions =====
+        # ===== Lambda Functions =====
+        # Every function follows the same Node.js 20 / ARM64 / shared-layer
+        # pattern, so they are declared as data below and built in one loop.
+        # Construct IDs, timeouts, env vars and descriptions match the
+        # previous hand-written blocks (no logical-ID churn); memory sizes,
+        # architecture, tracing, log retention, reserved concurrency and
+        # Insights are deliberate changes layered on top. Cross-cutting
+        # policies are one-line changes in make_fn.
 
-        # POST /orders - Create Order
-        self.create_order_fn = _lambda.Function(
-            self,
-            "CreateOrderFunction",
-            runtime=_lambda.Runtime.NODEJS_20_X,
-            handler="index.handler",
-            code=_lambda.Code.from_asset("../backend/functions/api/create-order/dist"),
-            layers=[self.shared_layer],
-            environment={
-                **common_env,
-                # Construct State Machine ARN from known pattern
-                "STATE_MACHINE_ARN": f"arn:aws:states:{self.region}:{self.account}:stateMachine:OrderFulfillmentSaga"
-            },
-            timeout=Duration.seconds(30),
-            memory_size=512,
-            tracing=_lambda.Tracing.ACTIVE,  # Enable X-Ray tracing
-            description="Creates new orders and triggers Step Functions workflow",
+        # ARNs referenced from several places below, computed once
+        self._saga_arn = (
+            f"arn:aws:states:{self.region}:{self.account}"
+            f":stateMachine:{SAGA_STATE_MACHINE_NAME}"
         )
-        
-        # Grant permission to start Step Functions executions
-        self.create_order_fn.add_to_role_policy(
-            iam.PolicyStatement(
-                actions=["states:StartExecution"],
-                resources=[f"arn:aws:states:{self.region}:{self.account}:stateMachine:OrderFulfillmentSaga"],
-                effect=iam.Effect.ALLOW,
-            )
+        self._stripe_secret_arn = (
+            f"arn:aws:secretsmanager:{self.region}:{self.account}"
+            ":secret:ecommerce/stripe/*"
         )
 
-        # Grant permission to read Stripe API key from Secrets Manager
-        self.create_order_fn.add_to_role_policy(
-            iam.PolicyStatement(
-                actions=["secretsmanager:GetSecretValue"],
-                resources=[f"arn:aws:secretsmanager:{self.region}:{self.account}:secret:ecommerce/stripe/*"],
+        ses_env = {
+            "SES_FROM_EMAIL": "KET126@pitt.edu",
+            "TEST_CUSTOMER_EMAIL": "kevintcolleges@gmail.com",
+        }
+
+        function_specs = [
+            # --- API functions ---
+            dict(
+                attr="create_order_fn",
+                cid="CreateOrderFunction",
+                path="api/create-order",
+                timeout=Duration.seconds(30),
+                env={"STATE_MACHINE_ARN": self._saga_arn},
+                # Bound API bursts so a spike can't fan out into thousands
+                # of concurrent DynamoDB writers and cascade into saga
+                # throttling downstream
+                reserved_concurrency=100,
+                insights=True,
+                desc="Creates new orders and triggers Step Functions workflow",
+            ),
+            dict(
+                attr="get_order_fn",
+                cid="GetOrderFunction",
+                path="api/get-order",
+                timeout=Duration.seconds(10),
+                reserved_concurrency=50,
+                insights=True,
+                desc="Retrieves order details by ID",
+            ),
+            dict(
+                attr="list_products_fn",
+                cid="ListProductsFunction",
+                path="api/list-products",
+                timeout=Duration.seconds(10),
+                reserved_concurrency=50,
+                insights=True,
+                desc="Lists products with filtering and search",
+            ),
+            dict(
+                attr="check_inventory_fn",
+                cid="CheckInventoryFunction",
+                path="api/check-inventory",
+                timeout=Duration.seconds(10),
+                insights=True,
+                desc="Checks inventory availability for a product",
+            ),
+            dict(
+                attr="stripe_webhook_fn",
+                cid="StripeWebhookFunction",
+                path="api/stripe-webhook",
+                timeout=Duration.seconds(30),
+                # Webhook secret will be stored in Secrets Manager
+                # (optional for local dev)
+                env={"STATE_MACHINE_ARN": self._saga_arn},
+                # High-volume endpoint (Stripe retries aggressively)
+                log_retention=logs.RetentionDays.ONE_WEEK,
+                reserved_concurrency=100,
+                insights=True,
+                desc="Handles Stripe webhook events (payment confirmations)",
+            ),
+            # --- Admin functions ---
+            # Credentials are stored in Secrets Manager: ecommerce/admin/credentials
+            dict(
+                attr="admin_auth_fn",
+                cid="AdminAuthFunction",
+                path="api/admin-auth",
+                timeout=Duration.seconds(10),
+                env={"ADMIN_SESSIONS_TABLE_NAME": admin_sessions_table.table_name},
+                desc="Admin: Simple authentication for admin dashboard",
+            ),
+            dict(
+                attr="admin_authorizer_fn",
+                cid="AdminAuthorizerFunction",
+                path="api/admin-authorizer",
+                timeout=Duration.seconds(5),
+                # Fires on every admin request - a week of logs is plenty
+                log_retention=logs.RetentionDays.ONE_WEEK,
+                # The authorizer needs neither the shared layer nor the
+                # common table env - keep its init surface minimal
+                shared=False,
+                env={"ADMIN_SESSIONS_TABLE_NAME": admin_sessions_table.table_name},
+                # Guarantee headroom so background fan-out can't starve the
+                # request path of concurrency
+                reserved_concurrency=50,
+                desc="Lambda Authorizer: Validates admin session tokens",
+            ),
+            dict(
+                attr="admin_list_orders_fn",
+                cid="AdminListOrdersFunction",
+                path="api/admin-list-orders",
+                timeout=Duration.seconds(30),
+                desc="Admin: Lists all orders with filtering and pagination",
+            ),
+            dict(
+                attr="admin_cancel_order_fn",
+                cid="AdminCancelOrderFunction",
+                path="api/admin-cancel-order",
+                timeout=Duration.seconds(30),
+                desc="Admin: Cancels orders with refund and inventory release",
+            ),
+            dict(
+                attr="admin_update_inventory_fn",
+                cid="AdminUpdateInventoryFunction",
+                path="api/admin-update-inventory",
+                timeout=Duration.seconds(30),
+                desc="Admin: Updates inventory levels (set/add/subtract operations)",
+            ),
+            dict(
+                attr="admin_analytics_fn",
+                cid="AdminAnalyticsFunction",
+                path="api/admin-analytics",
+                timeout=Duration.seconds(30),
+                desc="Admin: Provides comprehensive analytics and metrics",
+            ),
+            # --- Step Functions task functions ---
+            dict(
+                attr="reserve_inventory_fn",
+                cid="ReserveInventoryStepFunction",
+                path="stepfunctions/reserve-inventory",
+                timeout=Duration.seconds(60),
+                desc="Reserves inventory for orders (Step Functions task)",
+            ),
+            dict(
+                attr="process_payment_fn",
+                cid="ProcessPaymentStepFunction",
+                path="stepfunctions/process-payment",
+                timeout=Duration.seconds(30),
+                desc="Processes payments with idempotency (Step Functions task)",
+            ),
+            dict(
+                attr="allocate_shipping_fn",
+                cid="AllocateShippingStepFunction",
+                path="stepfunctions/allocate-shipping",
+                timeout=Duration.seconds(30),
+                desc="Allocates shipping and generates tracking (Step Functions task)",
+            ),
+            dict(
+                attr="send_notification_fn",
+                cid="SendNotificationStepFunction",
+                path="stepfunctions/send-notification",
+                timeout=Duration.seconds(30),
+                env=ses_env,
+                desc="Sends order confirmation notifications via SES (Step Functions task)",
+            ),
+            dict(
+                attr="compensation_handler_fn",
+                cid="CompensationHandlerFunction",
+                path="events/compensation-handler",
+                timeout=Duration.seconds(60),
+                desc="Handles compensation/rollback for failed sagas",
+            ),
+            # --- Scheduled functions ---
+            dict(
+                attr="cleanup_abandoned_carts_fn",
+                cid="CleanupAbandonedCartsFunction",
+                path="scheduled/cleanup-abandoned-carts",
+                timeout=Duration.minutes(5),  # Allow time to process many orders
+                env={
+                    **ses_env,
+                    "ABANDONED_CART_TIMEOUT_MINUTES": "30",  # Configurable timeout
+                    "SEND_REMINDER_EMAILS": "false",  # "true" enables abandoned cart reminders
+                    "FRONTEND_URL": "https://d1fo7kayl20noe.cloudfront.net/",  # CloudFront frontend URL
+                },
+                # Bound the scheduled fan-out so a large abandoned-cart
+                # backlog can't eat the account's unreserved concurrency
+                reserved_concurrency=5,
+                desc="Releases inventory for abandoned carts and sends reminder emails",
+            ),
+        ]
+
+        def make_fn(spec):
+            uses_shared = spec.get("shared", True)
+            environment = (
+                {**common_env, **spec.get("env", {})}
+                if uses_shared
+                else dict(spec.get("env", {}))
+            )
+            return _lambda.Function(
+                self,
+                spec["cid"],
+                runtime=node_runtime,
+                architecture=_lambda.Architecture.ARM_64,
+                handler="index.handler",
+                code=_lambda.Code.from_asset(
+                    os.path.join(_BACKEND_FUNCTIONS_DIR, spec["path"], "dist"),
+                    # Sourcemaps are for local debugging, not the zip
+                    exclude=["*.map"],
+                ),
+                layers=(
+                    [self.deps_layer, self.shared_layer] if uses_shared else None
+                ),
+                environment=environment,
+                timeout=spec["timeout"],
+                memory_size=MEMORY_PROFILES[spec["cid"]],
+                description=spec["desc"],
+                # Cap log retention (the CDK default never expires, which
+                # grows CloudWatch storage and slows Insights queries)
+                log_retention=spec.get(
+                    "log_retention", logs.RetentionDays.ONE_MONTH
+                ),
+                reserved_concurrent_executions=spec.get("reserved_concurrency"),
+                # ACTIVE tracing makes CDK attach the AWS-managed X-Ray
+                # policy once per role, replacing the old 17 inline copies
+                tracing=_lambda.Tracing.ACTIVE,
+                # Lambda Insights (hot API paths only): init/CPU/memory
+                # telemetry ships out-of-band via the extension instead of
+                # being derived from polled invocation metrics
+                insights_version=(
+                    _lambda.LambdaInsightsVersion.VERSION_1_0_404_0
+                    if spec.get("insights")
+                    else None
+                ),
             )
-        )
 
-        # GET /orders/{orderId} - Get Order
-        self.get_order_fn = _lambda.Function(
-            self,
-            "GetOrderFunction",
-            runtime=_lambda.Runtime.NODEJS_20_X,
-            handler="index.handler",
-            code=_lambda.Code.from_asset("../backend/functions/api/get-order/dist"),
-            layers=[self.shared_layer],
-            environment=common_env,
-            timeout=Duration.seconds(10),
-            memory_size=256,
-            # Log groups created automatically by CDK
-            description="Retrieves order details by ID",
-        )
+        for spec in function_specs:
+            setattr(self, spec["attr"], make_fn(spec))
 
-        # GET /products - List Products
-        self.list_products_fn = _lambda.Function(
-            self,
-            "ListProductsFunction",
-            runtime=_lambda.Runtime.NODEJS_20_X,
-            handler="index.handler",
-            code=_lambda.Code.from_asset("../backend/functions/api/list-products/dist"),
-            layers=[self.shared_layer],
-            environment=common_env,
-            timeout=Duration.seconds(10),
-            memory_size=256,
-            # Log groups created automatically by CDK
-            description="Lists products with filtering and search",
-        )
+        # ===== Step Functions / Secrets Manager policies =====
 
-        # GET /inventory/{productId} - Check Inventory
-        self.check_inventory_fn = _lambda.Function(
+        # Grant permission to start Step Functions executions (shared
+        # managed policy, same pattern as StripeSecretsRead below)
+        start_saga_policy = iam.ManagedPolicy(
             self,
-            "CheckInventoryFunction",
-            runtime=_lambda.Runtime.NODEJS_20_X,
-            handler="index.handler",
-            code=_lambda.Code.from_asset("../backend/functions/api/check-inventory/dist"),
-            layers=[self.shared_layer],
-            environment=common_env,
-            timeout=Duration.seconds(10),
-            memory_size=256,
-            # Log groups created automatically by CDK
-            description="Checks inventory availability for a product",
+            "StartOrderSagaPolicy",
+            statements=[
+                iam.PolicyStatement(
+                    actions=["states:StartExecution"],
+                    resources=[self._saga_arn],
+                )
+            ],
         )
+        for fn in [self.create_order_fn, self.stripe_webhook_fn]:
+            fn.role.add_managed_policy(start_saga_policy)
 
-        # POST /webhooks/stripe - Stripe Webhook Handler
-        self.stripe_webhook_fn = _lambda.Function(
+        # Grant permission to read Stripe secrets (payments and refunds).
+        # One customer-managed policy shared by every function that talks to
+        # Stripe, instead of the same inline statement repeated per role.
+        stripe_secrets_policy = iam.ManagedPolicy(
             self,
-            "StripeWebhookFunction",
-            runtime=_lambda.Runtime.NODEJS_20_X,
-            handler="index.handler",
-            code=_lambda.Code.from_asset("../backend/functions/api/stripe-webhook/dist"),
-            layers=[self.shared_layer],
-            environment={
-                **common_env,
-                "STATE_MACHINE_ARN": f"arn:aws:states:{self.region}:{self.account}:stateMachine:OrderFulfillmentSaga",
-                # Webhook secret will be stored in Secrets Manager (optional for local dev)
-                # "STRIPE_WEBHOOK_SECRET": "whsec_..." # Set via Secrets Manager
-            },
-            timeout=Duration.seconds(30),
-            memory_size=512,
-            description="Handles Stripe webhook events (payment confirmations)",
-        )
-
-        # Grant webhook function permission to start Step Functions
-        self.stripe_webhook_fn.add_to_role_policy(
-            iam.PolicyStatement(
-                actions=["states:StartExecution"],
-                resources=[f"arn:aws:states:{self.region}:{self.account}:stateMachine:OrderFulfillmentSaga"],
-                effect=iam.Effect.ALLOW,
-            )
-        )
-
-        # Grant webhook function permission to read Stripe secrets
-        self.stripe_webhook_fn.add_to_role_policy(
-            iam.PolicyStatement(
-                actions=["secretsmanager:GetSecretValue"],
-                resources=[f"arn:aws:secretsmanager:{self.region}:{self.account}:secret:ecommerce/stripe/*"],
-            )
+            "StripeSecretsRead",
+            statements=[
+                iam.PolicyStatement(
+                    actions=["secretsmanager:GetSecretValue"],
+                    resources=[self._stripe_secret_arn],
+                )
+            ],
         )
+        for fn in [
+            self.create_order_fn,
+            self.stripe_webhook_fn,
+            self.admin_cancel_order_fn,
+            self.process_payment_fn,
+            self.compensation_handler_fn,
+        ]:
+            fn.role.add_managed_policy(stripe_secrets_policy)
 
         orders_table.grant_read_write_data(self.stripe_webhook_fn)
 
-        # ===== Admin Lambda Functions =====
-
-        # POST /admin/auth - Admin Authentication
-        # Credentials are stored in AWS Secrets Manager: ecommerce/admin/credentials
-        self.admin_auth_fn = _lambda.Function(
-            self,
-            "AdminAuthFunction",
-            runtime=_lambda.Runtime.NODEJS_20_X,
-            handler="index.handler",
-            code=_lambda.Code.from_asset("../backend/functions/api/admin-auth/dist"),
-            layers=[self.shared_layer],
-            environment={
-                **common_env,
-                "ADMIN_SESSIONS_TABLE_NAME": admin_sessions_table.table_name,
-            },
-            timeout=Duration.seconds(10),
-            memory_size=256,
-            description="Admin: Simple authentication for admin dashboard",
-        )
-
         # Grant access to admin credentials in Secrets Manager
         self.admin_auth_fn.add_to_role_policy(
             iam.PolicyStatement(
@@ -233,187 +450,9 @@ class LambdaStack(Stack):
         # Grant access to admin sessions table
         admin_sessions_table.grant_read_write_data(self.admin_auth_fn)
 
-        # Lambda Authorizer - Admin Session Token Validation
-        self.admin_authorizer_fn = _lambda.Function(
-            self,
-            "AdminAuthorizerFunction",
-            runtime=_lambda.Runtime.NODEJS_20_X,
-            handler="index.handler",
-            code=_lambda.Code.from_asset("../backend/functions/api/admin-authorizer/dist"),
-            environment={
-                "ADMIN_SESSIONS_TABLE_NAME": admin_sessions_table.table_name,
-            },
-            timeout=Duration.seconds(5),
-            memory_size=256,
-            description="Lambda Authorizer: Validates admin session tokens",
-        )
-
         # Grant authorizer read access to sessions table
         admin_sessions_table.grant_read_data(self.admin_authorizer_fn)
 
-        # GET /admin/orders - List All Orders (Admin)
-        self.admin_list_orders_fn = _lambda.Function(
-            self,
-            "AdminListOrdersFunction",
-            runtime=_lambda.Runtime.NODEJS_20_X,
-            handler="index.handler",
-            code=_lambda.Code.from_asset("../backend/functions/api/admin-list-orders/dist"),
-            layers=[self.shared_layer],
-            environment=common_env,
-            timeout=Duration.seconds(30),
-            memory_size=512,
-            description="Admin: Lists all orders with filtering and pagination",
-        )
-
-        # POST /admin/orders/{orderId}/cancel - Cancel Order (Admin)
-        self.admin_cancel_order_fn = _lambda.Function(
-            self,
-            "AdminCancelOrderFunction",
-            runtime=_lambda.Runtime.NODEJS_20_X,
-            handler="index.handler",
-            code=_lambda.Code.from_asset("../backend/functions/api/admin-cancel-order/dist"),
-            layers=[self.shared_layer],
-            environment=common_env,
-            timeout=Duration.seconds(30),
-            memory_size=512,
-            description="Admin: Cancels orders with refund and inventory release",
-        )
-
-        # Grant admin cancel order access to Stripe secrets for refunds
-        self.admin_cancel_order_fn.add_to_role_policy(
-            iam.PolicyStatement(
-                actions=["secretsmanager:GetSecretValue"],
-                resources=[f"arn:aws:secretsmanager:{self.region}:{self.account}:secret:ecommerce/stripe/*"],
-            )
-        )
-
-        # PUT /admin/inventory/{productId} - Update Inventory (Admin)
-        self.admin_update_inventory_fn = _lambda.Function(
-            self,
-            "AdminUpdateInventoryFunction",
-            runtime=_lambda.Runtime.NODEJS_20_X,
-            handler="index.handler",
-            code=_lambda.Code.from_asset("../backend/functions/api/admin-update-inventory/dist"),
-            layers=[self.shared_layer],
-            environment=common_env,
-            timeout=Duration.seconds(30),
-            memory_size=512,
-            description="Admin: Updates inventory levels (set/add/subtract operations)",
-        )
-
-        # GET /admin/analytics - Analytics Dashboard (Admin)
-        self.admin_analytics_fn = _lambda.Function(
-            self,
-            "AdminAnalyticsFunction",
-            runtime=_lambda.Runtime.NODEJS_20_X,
-            handler="index.handler",
-            code=_lambda.Code.from_asset("../backend/functions/api/admin-analytics/dist"),
-            layers=[self.shared_layer],
-            environment=common_env,
-            timeout=Duration.seconds(30),
-            memory_size=512,
-            description="Admin: Provides comprehensive analytics and metrics",
-        )
-
-        # ===== Step Functions Task Lambda Functions =====
-
-        # Reserve Inventory - Step Functions task version
-        self.reserve_inventory_fn = _lambda.Function(
-            self,
-            "ReserveInventoryStepFunction",
-            runtime=_lambda.Runtime.NODEJS_20_X,
-            handler="index.handler",
-            code=_lambda.Code.from_asset("../backend/functions/stepfunctions/reserve-inventory/dist"),
-            layers=[self.shared_layer],
-            environment=common_env,
-            timeout=Duration.seconds(60),
-            memory_size=512,
-            description="Reserves inventory for orders (Step Functions task)",
-        )
-
-        # Process Payment - Step Functions task version
-        self.process_payment_fn = _lambda.Function(
-            self,
-            "ProcessPaymentStepFunction",
-            runtime=_lambda.Runtime.NODEJS_20_X,
-            handler="index.handler",
-            code=_lambda.Code.from_asset("../backend/functions/stepfunctions/process-payment/dist"),
-            layers=[self.shared_layer],
-            environment=common_env,
-            timeout=Duration.seconds(30),
-            memory_size=256,
-            description="Processes payments with idempotency (Step Functions task)",
-        )
-
-        # Allocate Shipping - Step Functions task version
-        self.allocate_shipping_fn = _lambda.Function(
-            self,
-            "AllocateShippingStepFunction",
-            runtime=_lambda.Runtime.NODEJS_20_X,
-            handler="index.handler",
-            code=_lambda.Code.from_asset("../backend/functions/stepfunctions/allocate-shipping/dist"),
-            layers=[self.shared_layer],
-            environment=common_env,
-            timeout=Duration.seconds(30),
-            memory_size=256,
-            description="Allocates shipping and generates tracking (Step Functions task)",
-        )
-
-        # Send Notification - Step Functions task version
-        self.send_notification_fn = _lambda.Function(
-            self,
-            "SendNotificationStepFunction",
-            runtime=_lambda.Runtime.NODEJS_20_X,
-            handler="index.handler",
-            code=_lambda.Code.from_asset("../backend/functions/stepfunctions/send-notification/dist"),
-            layers=[self.shared_layer],
-            environment={
-                **common_env,
-                "SES_FROM_EMAIL": "KET126@pitt.edu",
-                "TEST_CUSTOMER_EMAIL": "kevintcolleges@gmail.com",
-            },
-            timeout=Duration.seconds(30),
-            memory_size=256,
-            description="Sends order confirmation notifications via SES (Step Functions task)",
-        )
-
-        # Compensation Handler - Rolls back failed transactions
-        self.compensation_handler_fn = _lambda.Function(
-            self,
-            "CompensationHandlerFunction",
-            runtime=_lambda.Runtime.NODEJS_20_X,
-            handler="index.handler",
-            code=_lambda.Code.from_asset("../backend/functions/events/compensation-handler/dist"),
-            layers=[self.shared_layer],
-            environment=common_env,
-            timeout=Duration.seconds(60),
-            memory_size=512,
-            description="Handles compensation/rollback for failed sagas",
-        )
-
-        # ===== Scheduled Lambda Functions =====
-
-        # Cleanup Abandoned Carts - Scheduled function to release inventory
-        self.cleanup_abandoned_carts_fn = _lambda.Function(
-            self,
-            "CleanupAbandonedCartsFunction",
-            runtime=_lambda.Runtime.NODEJS_20_X,
-            handler="index.handler",
-            code=_lambda.Code.from_asset("../backend/functions/scheduled/cleanup-abandoned-carts/dist"),
-            layers=[self.shared_layer],
-            environment={
-                **common_env,
-                "ABANDONED_CART_TIMEOUT_MINUTES": "30",  # Configurable timeout
-                "SEND_REMINDER_EMAILS": "false",  # Set to "true" to enable abandoned cart reminders
-                "SES_FROM_EMAIL": "KET126@pitt.edu",
-                "TEST_CUSTOMER_EMAIL": "kevintcolleges@gmail.com",
-                "FRONTEND_URL": "https://d1fo7kayl20noe.cloudfront.net/",  # CloudFront frontend URL
-            },
-            timeout=Duration.minutes(5),  # Allow time to process many orders
-            memory_size=512,
-            description="Releases inventory for abandoned carts and sends reminder emails",
-        )
-
         # Create EventBridge Rule to trigger cleanup every 10 minutes
         cleanup_rule = events.Rule(
             self,
@@ -427,13 +466,26 @@ class LambdaStack(Stack):
 
         # ===== Grant Permissions =====
 
-        # API Functions need read/write access to tables
-        for fn in [self.create_order_fn, self.get_order_fn, self.list_products_fn, self.check_inventory_fn]:
-            orders_table.grant_read_write_data(fn)
-            products_table.grant_read_write_data(fn)
-            inventory_table.grant_read_write_data(fn)
-            idempotency_table.grant_read_write_data(fn)
-            if event_bus:
+        # Grants follow what each handler actually touches (see the
+        # repositories each function imports) - the read paths were
+        # previously over-granted read/write on all four tables
+        orders_table.grant_read_write_data(self.create_order_fn)
+        products_table.grant_read_data(self.create_order_fn)
+        inventory_table.grant_read_write_data(self.create_order_fn)
+        idempotency_table.grant_read_write_data(self.create_order_fn)
+
+        orders_table.grant_read_data(self.get_order_fn)
+        products_table.grant_read_data(self.list_products_fn)
+        products_table.grant_read_data(self.check_inventory_fn)
+        inventory_table.grant_read_data(self.check_inventory_fn)
+
+        if event_bus:
+            for fn in [
+                self.create_order_fn,
+                self.get_order_fn,
+                self.list_products_fn,
+                self.check_inventory_fn,
+            ]:
                 event_bus.grant_put_events_to(fn)
 
         # ===== Admin Lambda Permissions =====
@@ -463,54 +515,46 @@ class LambdaStack(Stack):
         # Grant process payment access to DynamoDB
         orders_table.grant_read_write_data(self.process_payment_fn)
         idempotency_table.grant_read_write_data(self.process_payment_fn)
-        
-        # Grant access to Stripe secret in Secrets Manager
-        self.process_payment_fn.add_to_role_policy(
-            iam.PolicyStatement(
-                actions=["secretsmanager:GetSecretValue"],
-                resources=[
-                    f"arn:aws:secretsmanager:{self.region}:{self.account}:secret:ecommerce/stripe/*"
-                ]
-            )
-        )
 
         # Grant allocate shipping access to DynamoDB
         orders_table.grant_read_write_data(self.allocate_shipping_fn)
 
         # Grant send notification access to DynamoDB and SES
         orders_table.grant_read_data(self.send_notification_fn)
-        self.send_notification_fn.add_to_role_policy(
-            iam.PolicyStatement(
-                actions=["ses:SendEmail", "ses:SendRawEmail"],
-                resources=["*"],  # TODO: In production, scope this down to specific email addresses
-            )
+
+        # Both email-sending functions share one policy scoped to the
+        # verified sender identity, with a FromAddress condition so the
+        # grant cannot be used to spoof another sender
+        ses_sender_policy = iam.ManagedPolicy(
+            self,
+            "SesSenderPolicy",
+            statements=[
+                iam.PolicyStatement(
+                    actions=["ses:SendEmail", "ses:SendRawEmail"],
+                    resources=[
+                        f"arn:aws:ses:{self.region}:{self.account}"
+                        f":identity/{ses_env['SES_FROM_EMAIL']}"
+                    ],
+                    conditions={
+                        "StringEquals": {
+                            "ses:FromAddress": ses_env["SES_FROM_EMAIL"]
+                        }
+                    },
+                )
+            ],
         )
+        self.send_notification_fn.role.add_managed_policy(ses_sender_policy)
 
         # Grant compensation handler access to DynamoDB
         orders_table.grant_read_write_data(self.compensation_handler_fn)
         inventory_table.grant_read_write_data(self.compensation_handler_fn)
 
-        # Grant access to Stripe secret for refunds
-        self.compensation_handler_fn.add_to_role_policy(
-            iam.PolicyStatement(
-                actions=["secretsmanager:GetSecretValue"],
-                resources=[
-                    f"arn:aws:secretsmanager:{self.region}:{self.account}:secret:ecommerce/stripe/*"
-                ]
-            )
-        )
-
         # Grant cleanup abandoned carts function access to DynamoDB
         orders_table.grant_read_write_data(self.cleanup_abandoned_carts_fn)
         inventory_table.grant_read_write_data(self.cleanup_abandoned_carts_fn)
 
         # Grant cleanup function permission to send emails via SES
-        self.cleanup_abandoned_carts_fn.add_to_role_policy(
-            iam.PolicyStatement(
-                actions=["ses:SendEmail", "ses:SendRawEmail"],
-                resources=["*"],  # TODO: In production, scope this down to specific email addresses
-            )
-        )
+        self.cleanup_abandoned_carts_fn.role.add_managed_policy(ses_sender_policy)
 
         # Store references for other stacks
         self.api_functions = {
@@ -526,87 +570,27 @@ class LambdaStack(Stack):
             "admin_update_inventory": self.admin_update_inventory_fn,
             "admin_analytics": self.admin_analytics_fn,
         }
-        
-        # ===== Export Lambda ARNs for Step Functions Stack =====
-        # These exports allow StepFunctionsStack to reference Lambda functions
-        # without creating circular dependencies
-        
-        CfnOutput(
-            self,
-            "ReserveInventoryFunctionArnOutput",
-            value=self.reserve_inventory_fn.function_arn,
-            export_name="ReserveInventoryFunctionArn",
-            description="Reserve Inventory Lambda ARN for Step Functions",
-        )
-        
-        CfnOutput(
-            self,
-            "ProcessPaymentFunctionArnOutput",
-            value=self.process_payment_fn.function_arn,
-            export_name="ProcessPaymentFunctionArn",
-            description="Process Payment Lambda ARN for Step Functions",
-        )
-        
-        CfnOutput(
-            self,
-            "AllocateShippingFunctionArnOutput",
-            value=self.allocate_shipping_fn.function_arn,
-            export_name="AllocateShippingFunctionArn",
-            description="Allocate Shipping Lambda ARN for Step Functions",
-        )
-        
-        CfnOutput(
-            self,
-            "SendNotificationFunctionArnOutput",
-            value=self.send_notification_fn.function_arn,
-            export_name="SendNotificationFunctionArn",
-            description="Send Notification Lambda ARN for Step Functions",
-        )
-        
-        CfnOutput(
-            self,
-            "CompensationHandlerFunctionArnOutput",
-            value=self.compensation_handler_fn.function_arn,
-            export_name="CompensationHandlerFunctionArn",
-            description="Compensation Handler Lambda ARN for Step Functions",
-        )
 
-        # ===== Enable X-Ray Tracing on all Lambda functions =====
-        self._enable_xray_tracing()
-
-    def _enable_xray_tracing(self):
-        """
-        Enable AWS X-Ray active tracing on all Lambda functions.
-        This provides distributed tracing for the entire order fulfillment flow.
-        """
-        lambda_functions = [
-            self.create_order_fn,
-            self.get_order_fn,
-            self.list_products_fn,
-            self.check_inventory_fn,
-            self.stripe_webhook_fn,
-            self.admin_auth_fn,
-            self.admin_authorizer_fn,
-            self.admin_list_orders_fn,
-            self.admin_cancel_order_fn,
-            self.admin_update_inventory_fn,
-            self.admin_analytics_fn,
-            self.reserve_inventory_fn,
-            self.process_payment_fn,
-            self.allocate_shipping_fn,
-            self.send_notification_fn,
-            self.compensation_handler_fn,
-            self.cleanup_abandoned_carts_fn,
-        ]
-
-        for func in lambda_functions:
-            # Add X-Ray SDK to the function's execution role
-            func.add_to_role_policy(
-                iam.PolicyStatement(
-                    actions=[
-                        "xray:PutTraceSegments",
-                        "xray:PutTelemetryRecords",
-                    ],
-                    resources=["*"],
+        # Optional provisioned concurrency on the user-visible request path
+        # (-c provisionedConcurrency=2). Aliases implement IFunction, so API
+        # Gateway integrations built from api_functions target the warmed
+        # "live" alias instead of $LATEST. Off by default: provisioned
+        # concurrency bills per GB-hour whether or not traffic arrives.
+        pc = self.node.try_get_context("provisionedConcurrency")
+        if pc:
+            for key in (
+                "create_order",
+                "get_order",
+                "list_products",
+                "check_inventory",
+                "stripe_webhook",
+                "admin_authorizer",
+            ):
+                fn = self.api_functions[key]
+                self.api_functions[key] = _lambda.Alias(
+                    self,
+                    f"{fn.node.id}LiveAlias",
+                    alias_name="live",
+                    version=fn.current_version,
+                    provisioned_concurrent_executions=int(pc),
                 )
-            )
\ No newline at end of file
@@ -41,6 +41,16 @@ class MonitoringStack(Stack):
         state_machine = stepfunctions_stack.state_machine
         api = api_gateway_stack.api
 
+        # Shared metric periods and reused Metric objects. Metrics are
+        # immutable descriptors, so one instance can back several widgets
+        # and alarms instead of re-allocating per use at synth time.
+        p5 = Duration.minutes(5)
+        h1 = Duration.hours(1)
+        api_server_error_5m = api.metric_server_error(period=p5)
+        saga_started_5m = state_machine.metric_started(period=p5)
+        saga_succeeded_5m = state_machine.metric_succeeded(period=p5)
+        saga_failed_5m = state_machine.metric_failed(period=p5)
+
         # ===== SNS Topic for Alarms =====
         self.alarm_topic = sns.Topic(
             self,
@@ -76,7 +86,7 @@ class MonitoringStack(Stack):
             cloudwatch.GraphWidget(
                 title="API Request Count",
                 left=[
-                    api.metric_count(period=Duration.minutes(5)),
+                    api.metric_count(period=p5),
                 ],
                 width=12,
                 height=6,
@@ -84,7 +94,7 @@ class MonitoringStack(Stack):
             cloudwatch.GraphWidget(
                 title="API Latency",
                 left=[
-                    api.metric_latency(period=Duration.minutes(5)),
+                    api.metric_latency(period=p5),
                 ],
                 width=12,
                 height=6,
@@ -96,16 +106,14 @@ class MonitoringStack(Stack):
             cloudwatch.GraphWidget(
                 title="API 4XX Errors",
                 left=[
-                    api.metric_client_error(period=Duration.minutes(5)),
+                    api.metric_client_error(period=p5),
                 ],
                 width=12,
                 height=6,
             ),
             cloudwatch.GraphWidget(
                 title="API 5XX Errors",
-                left=[
-                    api.metric_server_error(period=Duration.minutes(5)),
-                ],
+                left=[api_server_error_5m],
                 width=12,
                 height=6,
             ),
@@ -124,18 +132,14 @@ class MonitoringStack(Stack):
         self.dashboard.add_widgets(
             cloudwatch.GraphWidget(
                 title="Saga Executions",
-                left=[
-                    state_machine.metric_started(period=Duration.minutes(5)),
-                    state_machine.metric_succeeded(period=Duration.minutes(5)),
-                    state_machine.metric_failed(period=Duration.minutes(5)),
-                ],
+                left=[saga_started_5m, saga_succeeded_5m, saga_failed_5m],
                 width=12,
                 height=6,
             ),
             cloudwatch.GraphWidget(
                 title="Saga Execution Time",
                 left=[
-                    state_machine.metric_time(period=Duration.minutes(5)),
+                    state_machine.metric_time(period=p5),
                 ],
                 width=12,
                 height=6,
@@ -159,32 +163,31 @@ class MonitoringStack(Stack):
             ("Process Payment", lambda_stack.process_payment_fn),
         ]
 
-        for i in range(0, len(key_functions), 2):
-            widgets = []
-            for j in range(2):
-                if i + j < len(key_functions):
-                    name, func = key_functions[i + j]
-                    widgets.append(
-                        cloudwatch.GraphWidget(
-                            title=f"{name} - Invocations & Errors",
-                            left=[
-                                func.metric_invocations(period=Duration.minutes(5)),
-                                func.metric_errors(period=Duration.minutes(5)),
-                            ],
-                            width=12,
-                            height=6,
-                        )
-                    )
-            self.dashboard.add_widgets(*widgets)
+        # One add_widgets call: the dashboard wraps rows at width 24 by
+        # itself, so the old 2-at-a-time batching only added layout reflows
+        self.dashboard.add_widgets(
+            *(
+                cloudwatch.GraphWidget(
+                    title=f"{name} - Invocations & Errors",
+                    left=[
+                        func.metric_invocations(period=p5),
+                        func.metric_errors(period=p5),
+                    ],
+                    width=12,
+                    height=6,
+                )
+                for name, func in key_functions
+            )
+        )
 
         # Lambda Duration
         self.dashboard.add_widgets(
             cloudwatch.GraphWidget(
                 title="Lambda Duration (ms)",
                 left=[
-                    api_functions["create_order"].metric_duration(period=Duration.minutes(5)),
-                    api_functions["stripe_webhook"].metric_duration(period=Duration.minutes(5)),
-                    lambda_stack.reserve_inventory_fn.metric_duration(period=Duration.minutes(5)),
+                    api_functions["create_order"].metric_duration(period=p5),
+                    api_functions["stripe_webhook"].metric_duration(period=p5),
+                    lambda_stack.reserve_inventory_fn.metric_duration(period=p5),
                 ],
                 width=24,
                 height=6,
@@ -210,11 +213,11 @@ class MonitoringStack(Stack):
                         using_metrics={
                             "started": state_machine.metric_started(
                                 statistic="Sum",
-                                period=Duration.hours(1),
+                                period=h1,
                             ),
                             "succeeded": state_machine.metric_succeeded(
                                 statistic="Sum",
-                                period=Duration.hours(1),
+                                period=h1,
                             ),
                         },
                     )
@@ -227,7 +230,7 @@ class MonitoringStack(Stack):
                 metrics=[
                     state_machine.metric_failed(
                         statistic="Sum",
-                        period=Duration.hours(1),
+                        period=h1,
                     )
                 ],
                 width=8,
@@ -238,7 +241,7 @@ class MonitoringStack(Stack):
                 metrics=[
                     api.metric_count(
                         statistic="Sum",
-                        period=Duration.hours(1),
+                        period=h1,
                     )
                 ],
                 width=8,
@@ -247,98 +250,90 @@ class MonitoringStack(Stack):
         )
 
         # ===== CloudWatch Alarms =====
-
-        # Alarm: Step Functions Failures
-        self.step_functions_failure_alarm = cloudwatch.Alarm(
-            self,
-            "StepFunctionsFailureAlarm",
-            metric=state_machine.metric_failed(
-                statistic="Sum",
-                period=Duration.minutes(5),
+        # All alarms share the same shape, so they are declared as data:
+        # (attr, construct id, metric, threshold, evaluation periods,
+        #  alarm name, description)
+        alarm_specs = [
+            (
+                "step_functions_failure_alarm",
+                "StepFunctionsFailureAlarm",
+                state_machine.metric_failed(statistic="Sum", period=p5),
+                3,
+                1,
+                "Ecommerce-StepFunctions-Failures",
+                "Alert when Step Functions saga fails 3+ times in 5 minutes",
             ),
-            threshold=3,
-            evaluation_periods=1,
-            datapoints_to_alarm=1,
-            alarm_name="Ecommerce-StepFunctions-Failures",
-            alarm_description="Alert when Step Functions saga fails 3+ times in 5 minutes",
-            treat_missing_data=cloudwatch.TreatMissingData.NOT_BREACHING,
-        )
-        self.step_functions_failure_alarm.add_alarm_action(
-            cw_actions.SnsAction(self.alarm_topic)
-        )
-
-        # Alarm: API Gateway 5XX Errors
-        self.api_5xx_alarm = cloudwatch.Alarm(
-            self,
-            "API5XXAlarm",
-            metric=api.metric_server_error(
-                statistic="Sum",
-                period=Duration.minutes(5),
+            (
+                "api_5xx_alarm",
+                "API5XXAlarm",
+                api.metric_server_error(statistic="Sum", period=p5),
+                10,
+                1,
+                "Ecommerce-API-5XX-Errors",
+                "Alert when API Gateway has 10+ 5XX errors in 5 minutes",
             ),
-            threshold=10,
-            evaluation_periods=1,
-            datapoints_to_alarm=1,
-            alarm_name="Ecommerce-API-5XX-Errors",
-            alarm_description="Alert when API Gateway has 10+ 5XX errors in 5 minutes",
-            treat_missing_data=cloudwatch.TreatMissingData.NOT_BREACHING,
-        )
-        self.api_5xx_alarm.add_alarm_action(cw_actions.SnsAction(self.alarm_topic))
-
-        # Alarm: Lambda Errors (Create Order)
-        self.create_order_error_alarm = cloudwatch.Alarm(
-            self,
-            "CreateOrderErrorAlarm",
-            metric=api_functions["create_order"].metric_errors(
-                statistic="Sum",
-                period=Duration.minutes(5),
+            (
+                "create_order_error_alarm",
+                "CreateOrderErrorAlarm",
+                api_functions["create_order"].metric_errors(
+                    statistic="Sum", period=p5
+                ),
+                5,
+                1,
+                "Ecommerce-CreateOrder-Errors",
+                "Alert when CreateOrder Lambda has 5+ errors in 5 minutes",
             ),
-            threshold=5,
-            evaluation_periods=1,
-            datapoints_to_alarm=1,
-            alarm_name="Ecommerce-CreateOrder-Errors",
-            alarm_description="Alert when CreateOrder Lambda has 5+ errors in 5 minutes",
-            treat_missing_data=cloudwatch.TreatMissingData.NOT_BREACHING,
-        )
-        self.create_order_error_alarm.add_alarm_action(
-            cw_actions.SnsAction(self.alarm_topic)
-        )
+            (
+                "lambda_throttle_alarm",
+                "LambdaThrottleAlarm",
+                api_functions["create_order"].metric_throttles(
+                    statistic="Sum", period=p5
+                ),
+                5,
+                1,
+                "Ecommerce-Lambda-Throttles",
+                "Alert when Lambda functions are throttled 5+ times in 5 minutes",
+            ),
+            (
+                "api_latency_alarm",
+                "APILatencyAlarm",
+                api.metric_latency(statistic="Average", period=p5),
+                3000,  # 3 seconds
+                2,
+                "Ecommerce-API-High-Latency",
+                "Alert when API latency exceeds 3 seconds for 10 minutes",
+            ),
+        ]
+
+        alarms = []
+        for attr, cid, metric, threshold, eval_periods, name, desc in alarm_specs:
+            alarm = cloudwatch.Alarm(
+                self,
+                cid,
+                metric=metric,
+                threshold=threshold,
+                evaluation_periods=eval_periods,
+                datapoints_to_alarm=eval_periods,
+                alarm_name=name,
+                alarm_description=desc,
+                treat_missing_data=cloudwatch.TreatMissingData.NOT_BREACHING,
+            )
+            setattr(self, attr, alarm)
+            alarms.append(alarm)
 
-        # Alarm: Lambda Throttles
-        self.lambda_throttle_alarm = cloudwatch.Alarm(
+        # Leaf alarms stay silent; one composite notifies the topic, so a
+        # single incident that trips several alarms at once (e.g. a Stripe
+        # outage failing sagas AND raising 5XXs) pages once, not five times
+        self.critical_composite_alarm = cloudwatch.CompositeAlarm(
             self,
-            "LambdaThrottleAlarm",
-            metric=api_functions["create_order"].metric_throttles(
-                statistic="Sum",
-                period=Duration.minutes(5),
-            ),
-            threshold=5,
-            evaluation_periods=1,
-            datapoints_to_alarm=1,
-            alarm_name="Ecommerce-Lambda-Throttles",
-            alarm_description="Alert when Lambda functions are throttled 5+ times in 5 minutes",
-            treat_missing_data=cloudwatch.TreatMissingData.NOT_BREACHING,
+            "EcommerceCriticalComposite",
+            composite_alarm_name="Ecommerce-Critical",
+            alarm_rule=cloudwatch.AlarmRule.any_of(*alarms),
         )
-        self.lambda_throttle_alarm.add_alarm_action(
+        self.critical_composite_alarm.add_alarm_action(
             cw_actions.SnsAction(self.alarm_topic)
         )
 
-        # Alarm: High API Latency
-        self.api_latency_alarm = cloudwatch.Alarm(
-            self,
-            "APILatencyAlarm",
-            metric=api.metric_latency(
-                statistic="Average",
-                period=Duration.minutes(5),
-            ),
-            threshold=3000,  # 3 seconds
-            evaluation_periods=2,
-            datapoints_to_alarm=2,
-            alarm_name="Ecommerce-API-High-Latency",
-            alarm_description="Alert when API latency exceeds 3 seconds for 10 minutes",
-            treat_missing_data=cloudwatch.TreatMissingData.NOT_BREACHING,
-        )
-        self.api_latency_alarm.add_alarm_action(cw_actions.SnsAction(self.alarm_topic))
-
         # ===== Outputs =====
         CfnOutput(
             self,
@@ -1,159 +1,141 @@
 from aws_cdk import (
     Stack,
     Duration,
+    Tags,
     aws_stepfunctions as sfn,
     aws_stepfunctions_tasks as tasks,
     aws_lambda as _lambda,
     aws_iam as iam,
+    aws_logs as logs,
     CfnOutput,
 )
 from constructs import Construct
 
+from .constants import SAGA_STATE_MACHINE_NAME
+
+# JsonPath references shared across task payloads. string_at returns a
+# plain deterministic placeholder, so one instance serves every payload
+# instead of allocating a new token per call site at synth time.
+_ORDER_ID = sfn.JsonPath.string_at("$.orderId")
+_ERROR_CAUSE = sfn.JsonPath.string_at("$.errorInfo.Cause")
+
+# Transient Lambda service faults worth retrying before giving up on a
+# state - applied to forward steps and compensation invokes alike
+_TRANSIENT_LAMBDA_ERRORS = [
+    "Lambda.ServiceException",
+    "Lambda.AWSLambdaException",
+    "Lambda.SdkClientException",
+    "Lambda.TooManyRequestsException",
+]
+
 
 class EcommerceStepFunctionsStack(Stack):
     """
     Step Functions State Machine Stack
     Defines the order fulfillment saga orchestrator
-    
-    Uses CloudFormation exports to reference Lambda functions
+
+    Receives the task Lambda functions directly from LambdaStack; CDK wires
+    the cross-stack references itself, so there are no named exports to
+    resolve at deploy time.
     """
 
     def __init__(
         self,
         scope: Construct,
         construct_id: str,
+        lambda_stack,
         **kwargs,
     ) -> None:
         super().__init__(scope, construct_id, **kwargs)
-        
-        # Import Lambda functions using CloudFormation exports
-        # These are exported by LambdaStack
-        from aws_cdk import Fn
-        
-        reserve_inventory_fn = _lambda.Function.from_function_arn(
-            self,
-            "ImportedReserveInventoryFn",
-            Fn.import_value("ReserveInventoryFunctionArn"),
-        )
-        
-        process_payment_fn = _lambda.Function.from_function_arn(
-            self,
-            "ImportedProcessPaymentFn",
-            Fn.import_value("ProcessPaymentFunctionArn"),
-        )
-        
-        allocate_shipping_fn = _lambda.Function.from_function_arn(
-            self,
-            "ImportedAllocateShippingFn",
-            Fn.import_value("AllocateShippingFunctionArn"),
-        )
-        
-        send_notification_fn = _lambda.Function.from_function_arn(
-            self,
-            "ImportedSendNotificationFn",
-            Fn.import_value("SendNotificationFunctionArn"),
-        )
-        
-        compensation_handler_fn = _lambda.Function.from_function_arn(
-            self,
-            "ImportedCompensationHandlerFn",
-            Fn.import_value("CompensationHandlerFunctionArn"),
-        )
+
+        # Task Lambda functions built by LambdaStack
+        reserve_inventory_fn = lambda_stack.reserve_inventory_fn
+        process_payment_fn = lambda_stack.process_payment_fn
+        allocate_shipping_fn = lambda_stack.allocate_shipping_fn
+        send_notification_fn = lambda_stack.send_notification_fn
+        compensation_handler_fn = lambda_stack.compensation_handler_fn
 
         # ===== Define Task States =====
 
-        # Task 1: Reserve Inventory
-        reserve_inventory_task = tasks.LambdaInvoke(
-            self,
-            "ReserveInventoryTask",
-            lambda_function=reserve_inventory_fn,
-            payload=sfn.TaskInput.from_object(
-                {
-                    "orderId": sfn.JsonPath.string_at("$.orderId"),
-                }
+        # The four saga steps share one LambdaInvoke skeleton; only the
+        # function, the extra payload fields (pulled from prior step
+        # results), the result path and the task timeout differ, so they
+        # are declared as data. Every payload carries orderId. Each task
+        # timeout sits just above its Lambda's own timeout, so a hung
+        # invoke fails the state quickly instead of squatting on the
+        # execution until the 5-minute state-machine cap.
+        step_specs = [
+            (
+                "ReserveInventoryTask",
+                reserve_inventory_fn,
+                {},
+                "$.reservationResult",
+                Duration.seconds(65),
             ),
-            result_path="$.reservationResult",
-            retry_on_service_exceptions=False,
-        )
-
-        # Task 2: Process Payment
-        process_payment_task = tasks.LambdaInvoke(
-            self,
-            "ProcessPaymentTask",
-            lambda_function=process_payment_fn,
-            payload=sfn.TaskInput.from_object(
-                {
-                    "orderId": sfn.JsonPath.string_at("$.orderId"),
-                    "reservedItems": sfn.JsonPath.string_at(
-                        "$.reservationResult.Payload.reservedItems"
-                    ),
-                }
+            (
+                "ProcessPaymentTask",
+                process_payment_fn,
+                {"reservedItems": "$.reservationResult.reservedItems"},
+                "$.paymentResult",
+                Duration.seconds(35),
             ),
-            result_path="$.paymentResult",
-            retry_on_service_exceptions=False,
-        )
-
-        # Task 3: Allocate Shipping
-        allocate_shipping_task = tasks.LambdaInvoke(
-            self,
-            "AllocateShippingTask",
-            lambda_function=allocate_shipping_fn,
-            payload=sfn.TaskInput.from_object(
+            (
+                "AllocateShippingTask",
+                allocate_shipping_fn,
                 {
-                    "orderId": sfn.JsonPath.string_at("$.orderId"),
-                    "paymentId": sfn.JsonPath.string_at(
-                        "$.paymentResult.Payload.paymentId"
-                    ),
-                    "amount": sfn.JsonPath.string_at("$.paymentResult.Payload.amount"),
-                }
+                    "paymentId": "$.paymentResult.paymentId",
+                    "amount": "$.paymentResult.amount",
+                },
+                "$.shippingResult",
+                Duration.seconds(35),
             ),
-            result_path="$.shippingResult",
-            retry_on_service_exceptions=False,
-        )
-
-        # Task 4: Send Notification
-        send_notification_task = tasks.LambdaInvoke(
-            self,
-            "SendNotificationTask",
-            lambda_function=send_notification_fn,
-            payload=sfn.TaskInput.from_object(
+            (
+                "SendNotificationTask",
+                send_notification_fn,
                 {
-                    "orderId": sfn.JsonPath.string_at("$.orderId"),
-                    "trackingNumber": sfn.JsonPath.string_at(
-                        "$.shippingResult.Payload.trackingNumber"
-                    ),
-                    "carrier": sfn.JsonPath.string_at(
-                        "$.shippingResult.Payload.carrier"
-                    ),
-                    "estimatedDelivery": sfn.JsonPath.string_at(
-                        "$.shippingResult.Payload.estimatedDelivery"
-                    ),
-                }
+                    "trackingNumber": "$.shippingResult.trackingNumber",
+                    "carrier": "$.shippingResult.carrier",
+                    "estimatedDelivery": "$.shippingResult.estimatedDelivery",
+                },
+                # Nothing downstream reads the notification result; drop it
+                # instead of carrying it into the terminal state.
+                sfn.JsonPath.DISCARD,
+                Duration.seconds(35),
             ),
-            result_path="$.notificationResult",
-            retry_on_service_exceptions=False,
-        )
+        ]
 
-        # Compensation Task: Rollback on failure
-        compensate_task = tasks.LambdaInvoke(
-            self,
-            "CompensateTask",
-            lambda_function=compensation_handler_fn,
-            payload=sfn.TaskInput.from_object(
-                {
-                    "orderId": sfn.JsonPath.string_at("$.orderId"),
-                    "failedStep": sfn.JsonPath.string_at("$.failedStep"),
-                    "error": sfn.JsonPath.string_at("$.error"),
-                }
-            ),
-            result_path="$.compensationResult",
-            retry_on_service_exceptions=False,
-        )
+        step_tasks = [
+            tasks.LambdaInvoke(
+                self,
+                cid,
+                lambda_function=fn,
+                payload=sfn.TaskInput.from_object(
+                    {
+                        "orderId": _ORDER_ID,
+                        **{
+                            key: sfn.JsonPath.string_at(path)
+                            for key, path in fields.items()
+                        },
+                    }
+                ),
+                result_path=result_path,
+                payload_response_only=True,
+                retry_on_service_exceptions=False,
+                task_timeout=sfn.Timeout.duration(task_timeout),
+            )
+            for cid, fn, fields, result_path, task_timeout in step_specs
+        ]
+        (
+            reserve_inventory_task,
+            process_payment_task,
+            allocate_shipping_task,
+            send_notification_task,
+        ) = step_tasks
 
         # Success State
         success_state = sfn.Succeed(
             self,
-            "OrderFulfillmentComplete",
+            "OrderFulfillmentSucceeded",
             comment="Order fulfilled successfully",
         )
 
@@ -167,60 +149,60 @@ class EcommerceStepFunctionsStack(Stack):
 
         # ===== Define Error Handling =====
 
-        # Define failure pass states first
-        set_inventory_failure = sfn.Pass(
-            self,
-            "SetInventoryFailure",
-            parameters={
-                "orderId.$": "$.orderId",
-                "failedStep": "INVENTORY",
-                "error.$": "$.errorInfo.Cause",
-            },
-        )
+        # One thin compensation invoke per failing step, with the step name
+        # baked into the payload. The old shape routed every catcher through
+        # a Pass state that only rewrote the envelope before a shared
+        # compensation task - three extra state transitions per failure.
+        def make_compensate_task(failed_step: str) -> tasks.LambdaInvoke:
+            task = tasks.LambdaInvoke(
+                self,
+                f"Compensate{failed_step.capitalize()}Failure",
+                lambda_function=compensation_handler_fn,
+                payload=sfn.TaskInput.from_object(
+                    {
+                        "orderId": _ORDER_ID,
+                        "failedStep": failed_step,
+                        "error": _ERROR_CAUSE,
+                    }
+                ),
+                result_path=sfn.JsonPath.DISCARD,
+                payload_response_only=True,
+                retry_on_service_exceptions=False,
+                task_timeout=sfn.Timeout.duration(Duration.seconds(65)),
+            )
+            # A throttled compensation must not abandon the rollback
+            # (inventory stays reserved, payment uncaptured), so transient
+            # faults retry here exactly as on the forward steps
+            task.add_retry(
+                errors=_TRANSIENT_LAMBDA_ERRORS,
+                interval=Duration.seconds(1),
+                max_attempts=3,
+                backoff_rate=2.0,
+            )
+            task.next(failure_state)
+            return task
 
-        set_payment_failure = sfn.Pass(
-            self,
-            "SetPaymentFailure",
-            parameters={
-                "orderId.$": "$.orderId",
-                "failedStep": "PAYMENT",
-                "error.$": "$.errorInfo.Cause",
-            },
-        )
-
-        set_shipping_failure = sfn.Pass(
-            self,
-            "SetShippingFailure",
-            parameters={
-                "orderId.$": "$.orderId",
-                "failedStep": "SHIPPING",
-                "error.$": "$.errorInfo.Cause",
-            },
-        )
-
-        # Connect failure states to compensation
-        set_inventory_failure.next(compensate_task)
-        set_payment_failure.next(compensate_task)
-        set_shipping_failure.next(compensate_task)
-
-        # Add error catchers
-        reserve_inventory_task.add_catch(
-            set_inventory_failure,
-            errors=["States.ALL"],
-            result_path="$.errorInfo",
-        )
-
-        process_payment_task.add_catch(
-            set_payment_failure,
-            errors=["States.ALL"],
-            result_path="$.errorInfo",
-        )
-
-        allocate_shipping_task.add_catch(
-            set_shipping_failure,
-            errors=["States.ALL"],
-            result_path="$.errorInfo",
-        )
+        # Retry the transient Lambda service faults (throttles, internal
+        # errors) before falling through to compensation; the
+        # retry_on_service_exceptions default is disabled above so this
+        # list is the single source of truth. Business failures raised by
+        # the handlers are not listed and still compensate immediately.
+        # The notification step has no compensating action, so it retries
+        # but carries no catcher.
+        failed_step_names = ["INVENTORY", "PAYMENT", "SHIPPING", None]
+        for task, failed_step in zip(step_tasks, failed_step_names):
+            task.add_retry(
+                errors=_TRANSIENT_LAMBDA_ERRORS,
+                interval=Duration.seconds(1),
+                max_attempts=3,
+                backoff_rate=2.0,
+            )
+            if failed_step:
+                task.add_catch(
+                    make_compensate_task(failed_step),
+                    errors=["States.ALL"],
+                    result_path="$.errorInfo",
+                )
 
         # ===== Define Workflow =====
 
@@ -232,28 +214,49 @@ class EcommerceStepFunctionsStack(Stack):
             .next(success_state)
         )
 
-        # Compensation flows to failure
-        compensate_task.next(failure_state)
-
         # ===== Create State Machine =====
 
+        # EXPRESS: the saga is short (well under the 5-minute Express cap)
+        # and started asynchronously, so it runs in-memory without paying
+        # the STANDARD per-transition overhead and billing. Express keeps
+        # no execution history, so errors go to a log group instead;
+        # ERROR-only without execution data keeps ingestion near zero.
+        log_group = logs.LogGroup(
+            self,
+            "SagaLogGroup",
+            retention=logs.RetentionDays.ONE_MONTH,
+        )
+
         self.state_machine = sfn.StateMachine(
             self,
             "OrderFulfillmentSaga",
-            state_machine_name="OrderFulfillmentSaga",
+            state_machine_name=SAGA_STATE_MACHINE_NAME,
+            state_machine_type=sfn.StateMachineType.EXPRESS,
+            tracing_enabled=True,
             definition_body=sfn.DefinitionBody.from_chainable(workflow_definition),
             timeout=Duration.minutes(5),
+            logs=sfn.LogOptions(
+                destination=log_group,
+                level=sfn.LogLevel.ERROR,
+                include_execution_data=False,
+            ),
             comment="Order Fulfillment Saga - Reserve → Pay → Ship → Notify",
         )
 
+        # Component tag for cost allocation; the app-wide tags (Project,
+        # Environment, ManagedBy) come from app.py
+        Tags.of(self.state_machine).add("Component", "OrderFulfillmentSaga")
+
         # ===== Outputs =====
 
+        # No named export: the webhook receives the ARN through its
+        # environment and no other stack imports it, so a plain output is
+        # enough and nothing locks this stack against updates.
         CfnOutput(
             self,
             "StateMachineArn",
             value=self.state_machine.state_machine_arn,
             description="Order Fulfillment State Machine ARN",
-            export_name="OrderFulfillmentStateMachineArn",
         )
 
         CfnOutput(
@@ -0,0 +1,20 @@
+import aws_cdk as core
+import aws_cdk.assertions as assertions
+
+from infrastructure.stacks.event_stack import (
+    EventStack,
+    QUEUE_SPECS,
+    VISIBILITY_MULTIPLIER,
+)
+
+
+def test_queue_visibility_timeouts_cover_consumer_timeouts():
+    app = core.App()
+    stack = EventStack(app, "events")
+    template = assertions.Template.from_stack(stack)
+
+    for name, consumer_timeout_seconds in QUEUE_SPECS:
+        template.has_resource_properties("AWS::SQS::Queue", {
+            "QueueName": f"{name.lower()}-queue",
+            "VisibilityTimeout": consumer_timeout_seconds * VISIBILITY_MULTIPLIER,
+        })